@@ -15,10 +15,18 @@ Key classes:
 
 from __future__ import annotations
 
+import contextlib
+import hashlib
+import io
+import mmap
+import os
 import shutil
 import subprocess
+import threading
 from abc import ABC, abstractmethod
+from functools import cached_property
 from pathlib import Path
+from typing import BinaryIO, ClassVar
 
 try:
     from rjsmin import jsmin
@@ -30,6 +38,267 @@ try:
 except ImportError:  # pragma: no cover
     Image = None
 
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - not available on Windows
+    fcntl = None
+
+# Directory (relative to the project root) holding processed-asset caches
+CACHE_DIR_NAME = ".medusa-cache"
+
+
+def _cache_key(version: int, *chunks: bytes) -> str:
+    """Return a content hash for a cache entry.
+
+    Args:
+        version: Processor cache version, bumped when output format changes.
+        *chunks: Byte strings that determine the processed output.
+
+    Returns:
+        Hex digest identifying the cache entry.
+    """
+    digest = hashlib.blake2b(str(version).encode(), digest_size=16)
+    for chunk in chunks:
+        digest.update(chunk)
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+def _file_cache_key(version: int, path: Path) -> str:
+    """Return the cache key for a file's contents without reading it.
+
+    The file is memory-mapped and hashed straight from the page cache, so
+    a cache hit never copies the file into Python memory. The result
+    matches _cache_key(version, path.read_bytes()).
+
+    Args:
+        version: Processor cache version.
+        path: File to hash.
+
+    Returns:
+        Hex digest identifying the cache entry.
+    """
+    digest = hashlib.blake2b(str(version).encode(), digest_size=16)
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                digest.update(mapped)
+    digest.update(b"\0")
+    return digest.hexdigest()
+
+
+# ioctl request number for FICLONE (copy-on-write clone) on Linux
+_FICLONE = 0x40049409
+
+
+# Buffer size for the userspace copy fallback
+_COPY_BUFSIZE = 1024 * 1024
+
+
+def _copy_range(src_fd: int, dst_fd: int, offset: int, count: int) -> int:
+    """Copy a byte range with os.copy_file_range (Linux 4.5+)."""
+    return os.copy_file_range(src_fd, dst_fd, count, offset, offset)
+
+
+def _send_range(src_fd: int, dst_fd: int, offset: int, count: int) -> int:
+    """Copy a byte range with os.sendfile."""
+    return os.sendfile(dst_fd, src_fd, offset, count)
+
+
+def _kernel_copy(src: BinaryIO, dst: BinaryIO) -> None:
+    """Copy an open file without routing its bytes through Python.
+
+    Tries a copy-on-write FICLONE reflink (btrfs, XFS), then in-kernel
+    os.copy_file_range() and os.sendfile() loops, and finally a buffered
+    userspace copy where none is supported (e.g. sendfile on macOS only
+    writes to sockets).
+
+    Args:
+        src: Source file opened for binary reading.
+        dst: Empty destination file opened for binary writing.
+    """
+    src_fd, dst_fd = src.fileno(), dst.fileno()
+    if fcntl is not None:
+        try:
+            fcntl.ioctl(dst_fd, _FICLONE, src_fd)
+            return
+        except OSError:
+            pass
+    size = os.fstat(src_fd).st_size
+    for copy_range in (_copy_range, _send_range):
+        sent = 0
+        try:
+            while sent < size:
+                count = copy_range(src_fd, dst_fd, sent, size - sent)
+                if count == 0:
+                    break
+                sent += count
+            return
+        except (AttributeError, OSError):
+            # Only fall back if nothing was written; a failure midway
+            # (e.g. disk full) is a real error.
+            if sent:
+                raise
+    shutil.copyfileobj(src, dst, _COPY_BUFSIZE)
+
+
+def _fast_copy(source: Path, dest: Path) -> None:
+    """Place source at dest while moving as few bytes as possible.
+
+    Tries a hardlink first, then a reflink or in-kernel copy. The
+    destination is removed first so a later write to dest can never
+    modify the linked source or cache entry. File metadata is not copied;
+    build outputs do not need the source's mtime or mode.
+
+    Args:
+        source: Source file path.
+        dest: Destination path.
+    """
+    dest.unlink(missing_ok=True)
+    try:
+        os.link(source, dest)
+        return
+    except OSError:
+        pass
+    with open(source, "rb") as src, open(dest, "wb") as dst:
+        _kernel_copy(src, dst)
+
+
+def _store_in_cache(built: Path, cache_file: Path) -> None:
+    """Copy a freshly processed file into the cache.
+
+    Caching is best-effort: an unwritable cache directory or a missing
+    build output simply leaves the entry absent.
+
+    Args:
+        built: Processed output file.
+        cache_file: Cache entry path.
+    """
+    # Write under a unique name and rename so concurrent workers never
+    # link a half-written entry.
+    partial = cache_file.with_name(
+        f"{cache_file.name}.{os.getpid()}.{threading.get_ident()}.tmp"
+    )
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        with open(built, "rb") as src, open(partial, "wb") as dst:
+            _kernel_copy(src, dst)
+        os.replace(partial, cache_file)
+    except OSError:
+        with contextlib.suppress(OSError):
+            partial.unlink()
+
+
+def _run_tool(cmd: list[str]) -> str | None:
+    """Run an external build tool that writes its output to a file.
+
+    stdout is discarded rather than captured, and stderr is only decoded
+    when the tool fails.
+
+    Args:
+        cmd: Command line to run.
+
+    Returns:
+        None on success, otherwise the tool's stripped stderr.
+    """
+    result = subprocess.run(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
+    if result.returncode == 0:
+        return None
+    return result.stderr.decode("utf-8", errors="replace").strip()
+
+
+# (name, PATH) -> result of shutil.which, including misses
+_WHICH_CACHE: dict[tuple[str, str], str | None] = {}
+
+
+def which_cached(name: str) -> str | None:
+    """Look up a tool on PATH once per process.
+
+    Unlike find_executable_cached(), misses are remembered too, since
+    optional system tools (oxipng, jpegoptim, ...) are usually absent and
+    each lookup stats every PATH entry. The cache is keyed on PATH, so
+    changing PATH triggers a fresh search; clear_executable_cache()
+    forgets everything.
+
+    Args:
+        name: Executable name.
+
+    Returns:
+        Path to executable or None.
+    """
+    key = (name, os.environ.get("PATH", ""))
+    try:
+        return _WHICH_CACHE[key]
+    except KeyError:
+        found = _WHICH_CACHE[key] = shutil.which(name)
+        return found
+
+
+def find_executable(name: str, project_root: Path) -> str | None:
+    """Find an executable in PATH or the project's node_modules.
+
+    Args:
+        name: Executable name.
+        project_root: Root directory of the project.
+
+    Returns:
+        Path to executable or None.
+    """
+    # Not which_cached: a remembered miss would hide a tool installed later
+    found = shutil.which(name)
+    if found:
+        return found
+    local = project_root / "node_modules" / ".bin" / name
+    if local.exists():
+        return str(local)
+    return None
+
+
+# (name, project root) -> executable path, shared across processors/builds
+_EXECUTABLE_CACHE: dict[tuple[str, str], str] = {}
+
+
+def find_executable_cached(name: str, project_root: Path) -> str | None:
+    """Find an executable, reusing earlier successful lookups.
+
+    Hits are shared across processor instances and builds in the same
+    process, and are revalidated with a single stat so a removed binary
+    is noticed. Misses are not cached, so a freshly installed tool is
+    picked up on the next lookup.
+
+    Args:
+        name: Executable name.
+        project_root: Root directory of the project.
+
+    Returns:
+        Path to executable or None.
+    """
+    key = (name, str(project_root))
+    found = _EXECUTABLE_CACHE.get(key)
+    if found is not None and os.path.exists(found):
+        return found
+    found = find_executable(name, project_root)
+    if found:
+        _EXECUTABLE_CACHE[key] = found
+    else:
+        _EXECUTABLE_CACHE.pop(key, None)
+    return found
+
+
+def clear_executable_cache() -> None:
+    """Forget all cached executable lookups."""
+    _EXECUTABLE_CACHE.clear()
+    _WHICH_CACHE.clear()
+
+
+def clear_asset_cache(project_root: Path) -> None:
+    """Delete the build cache so every asset and markdown page is rebuilt.
+
+    Args:
+        project_root: Root directory of the project.
+    """
+    shutil.rmtree(project_root / CACHE_DIR_NAME, ignore_errors=True)
+
 
 class BaseAssetProcessor(ABC):
     """Base class for asset processors.
@@ -37,13 +306,19 @@ class BaseAssetProcessor(ABC):
     This abstract base class defines the interface for asset processors
     and provides common functionality. Each subclass handles a specific
     type of asset, following the Single Responsibility Principle.
+
+    Subclasses may set HANDLED_SUFFIXES to the lowercase file suffixes they
+    accept, letting the registry skip them for other files without calling
+    can_process(). None means the processor may accept any suffix.
     """
 
-    @property
-    @abstractmethod
-    def priority(self) -> int:
-        """Return processor priority (higher = checked first)."""
-        ...
+    HANDLED_SUFFIXES: frozenset[str] | None = None
+
+    # Processor priority (higher = checked first)
+    priority: ClassVar[int] = 0
+
+    # Output directories known to exist; shared by a registry's processors
+    known_dirs: set[Path] | None = None
 
     @abstractmethod
     def can_process(self, path: Path) -> bool:
@@ -70,19 +345,49 @@ class BaseAssetProcessor(ABC):
         """
         ...
 
+    def ensure_dest_dir(self, dest: Path) -> None:
+        """Create the parent directory of dest unless it is known to exist.
+
+        Args:
+            dest: Destination path about to be written.
+        """
+        parent = dest.parent
+        known = self.known_dirs
+        if known is not None and parent in known:
+            return
+        parent.mkdir(parents=True, exist_ok=True)
+        if known is not None:
+            known.add(parent)
+
 
 class ImageProcessor(BaseAssetProcessor):
-    """Optimizes image files using PIL.
+    """Optimizes image files.
+
+    Supports PNG, JPG, JPEG, and WebP formats. PNGs are optimized with
+    oxipng and JPEGs losslessly with jpegoptim or jpegtran when those tools
+    are installed; otherwise PIL re-encodes the image. Falls back to simple copying
+    if neither is available.
 
-    Supports PNG, JPG, JPEG, and WebP formats. Falls back to
-    simple copying if PIL is not available.
+    When constructed with a project root, optimized images are cached
+    under ``.medusa-cache/img`` keyed on a hash of the source bytes.
     """
 
     SUPPORTED_EXTENSIONS = {".png", ".jpg", ".jpeg", ".webp"}
+    HANDLED_SUFFIXES = frozenset(SUPPORTED_EXTENSIONS)
+    priority = 100
+    CACHE_VERSION = 1
+    JPEG_QUALITY = 85
 
-    @property
-    def priority(self) -> int:
-        return 100
+    def __init__(self, project_root: Path | None = None):
+        """Initialize the image processor.
+
+        Args:
+            project_root: Optional project root; enables the image cache.
+        """
+        self.project_root = project_root
+        self._cache_dir = (
+            project_root / CACHE_DIR_NAME / "img" if project_root is not None else None
+        )
 
     def can_process(self, path: Path) -> bool:
         """Check if this is a supported image file."""
@@ -98,19 +403,111 @@ class ImageProcessor(BaseAssetProcessor):
         Returns:
             True if processing was successful.
         """
-        dest.parent.mkdir(parents=True, exist_ok=True)
+        self.ensure_dest_dir(dest)
+
+        cache_file = None
+        if self._cache_dir is not None:
+            key = _file_cache_key(self.CACHE_VERSION, source)
+            cache_file = self._cache_dir / f"{key}{source.suffix.lower()}"
+            if cache_file.exists():
+                _fast_copy(cache_file, dest)
+                return True
+        dest.unlink(missing_ok=True)
+
+        if self._optimize(source, dest):
+            if cache_file is not None:
+                _store_in_cache(dest, cache_file)
+            return True
+
+        # Fallback: simple copy
+        _fast_copy(source, dest)
+        return True
+
+    def _optimize(self, source: Path, dest: Path) -> bool:
+        """Write an optimized copy of source to dest.
+
+        Args:
+            source: Source image path.
+            dest: Destination path.
+
+        Returns:
+            True if an optimizer produced dest.
+        """
+        suffix = source.suffix.lower()
+        if suffix == ".png" and self._oxipng_bin:
+            result = subprocess.run(
+                [
+                    self._oxipng_bin,
+                    "-o",
+                    "2",
+                    "--strip",
+                    "safe",
+                    "--out",
+                    str(dest),
+                    str(source),
+                ],
+                capture_output=True,
+            )
+            if result.returncode == 0:
+                return True
+        elif suffix in (".jpg", ".jpeg") and self._jpegoptim_bin:
+            result = subprocess.run(
+                [self._jpegoptim_bin, "--strip-all", "--stdout", str(source)],
+                capture_output=True,
+            )
+            if result.returncode == 0 and result.stdout:
+                dest.write_bytes(result.stdout)
+                return True
+        elif suffix in (".jpg", ".jpeg") and self._jpegtran_bin:
+            result = subprocess.run(
+                [
+                    self._jpegtran_bin,
+                    "-optimize",
+                    "-progressive",
+                    "-copy",
+                    "none",
+                    "-outfile",
+                    str(dest),
+                    str(source),
+                ],
+                capture_output=True,
+            )
+            if result.returncode == 0:
+                return True
 
         if Image is not None:
             try:
+                # Encode in memory and write once: PIL otherwise issues a
+                # write per encoder block, and a failed encode would leave
+                # a truncated dest behind.
+                buffer = io.BytesIO()
                 with Image.open(source) as img:
-                    img.save(dest, optimize=True)
+                    img.save(
+                        buffer,
+                        format=img.format,
+                        optimize=True,
+                        quality=self.JPEG_QUALITY,
+                    )
+                dest.write_bytes(buffer.getbuffer())
                 return True
             except Exception:
                 pass
+        return False
 
-        # Fallback: simple copy
-        shutil.copy2(source, dest)
-        return True
+    @cached_property
+    def _oxipng_bin(self) -> str | None:
+        """oxipng executable, looked up once per processor."""
+        return which_cached("oxipng")
+
+    @cached_property
+    def _jpegoptim_bin(self) -> str | None:
+        """jpegoptim executable, looked up once per processor."""
+        return which_cached("jpegoptim")
+
+    @cached_property
+    def _jpegtran_bin(self) -> str | None:
+        """jpegtran executable, looked up once per processor."""
+        return which_cached("jpegtran")
 
 
 class CSSProcessor(BaseAssetProcessor):
@@ -120,9 +517,8 @@ class CSSProcessor(BaseAssetProcessor):
     Other CSS files are copied directly.
     """
 
-    @property
-    def priority(self) -> int:
-        return 90
+    HANDLED_SUFFIXES = frozenset({".css"})
+    priority = 90
 
     def can_process(self, path: Path) -> bool:
         """Check if this is a CSS file (but not main.css for Tailwind)."""
@@ -138,8 +534,8 @@ class CSSProcessor(BaseAssetProcessor):
         Returns:
             True if processing was successful.
         """
-        dest.parent.mkdir(parents=True, exist_ok=True)
-        shutil.copy2(source, dest)
+        self.ensure_dest_dir(dest)
+        _fast_copy(source, dest)
         return True
 
 
@@ -148,8 +544,25 @@ class TailwindCSSProcessor(BaseAssetProcessor):
 
     Handles main.css specifically, running through the Tailwind CLI
     for JIT compilation. Falls back to copying if Tailwind is not available.
+
+    The latest successful build is cached under ``.medusa-cache/css``,
+    keyed on the input CSS and the mtimes of every file Tailwind scans for
+    classes or may @import from the stylesheet directory.
     """
 
+    CACHE_VERSION = 1
+    HANDLED_SUFFIXES = frozenset({".css"})
+    priority = 95  # Higher than CSSProcessor to catch main.css first
+
+    # (directory, suffixes) whose files Tailwind scans for class names
+    CONTENT_SOURCES = (
+        ("site", (".md", ".jinja")),
+        ("assets", (".js",)),
+    )
+    # Stylesheets main.css can @import; they shape the output but are not
+    # passed to Tailwind as content
+    CSS_SOURCES = ("assets/css", (".css",))
+
     def __init__(self, project_root: Path, output_dir: Path):
         """Initialize the Tailwind processor.
 
@@ -159,10 +572,7 @@ class TailwindCSSProcessor(BaseAssetProcessor):
         """
         self.project_root = project_root
         self.output_dir = output_dir
-
-    @property
-    def priority(self) -> int:
-        return 95  # Higher than CSSProcessor to catch main.css first
+        self._cache_dir = project_root / CACHE_DIR_NAME / "css"
 
     def can_process(self, path: Path) -> bool:
         """Check if this is the Tailwind main.css file."""
@@ -178,22 +588,30 @@ class TailwindCSSProcessor(BaseAssetProcessor):
         Returns:
             True if processing was successful.
         """
-        dest.parent.mkdir(parents=True, exist_ok=True)
+        self.ensure_dest_dir(dest)
 
-        tailwind_bin = self._find_executable("tailwindcss")
+        tailwind_bin = self._tailwind_bin
         if not tailwind_bin:
             print("Tailwind CSS CLI not found; skipping CSS build.")
             print(
                 "Install with `npm install -g tailwindcss` or `npm install -D tailwindcss` in the project. "
                 "Falling back to unprocessed CSS."
             )
-            shutil.copy2(source, dest)
+            _fast_copy(source, dest)
             return True
 
+        content = [(path, os.stat(path)) for path in self._content_files()]
+        key = self._cache_key(source, tailwind_bin, content)
+        cache_file = self._cache_dir / f"{key}.css"
+        if cache_file.exists():
+            _fast_copy(cache_file, dest)
+            return True
+        dest.unlink(missing_ok=True)
+
         content_globs = [
-            str(self.project_root / "site" / "**" / "*.md"),
-            str(self.project_root / "site" / "**" / "*.jinja"),
-            str(self.project_root / "assets" / "**" / "*.js"),
+            str(self.project_root / base / "**" / f"*{suffix}")
+            for base, suffixes in self.CONTENT_SOURCES
+            for suffix in suffixes
         ]
 
         cmd = [
@@ -207,13 +625,81 @@ class TailwindCSSProcessor(BaseAssetProcessor):
             ",".join(content_globs),
         ]
 
-        result = subprocess.run(cmd, capture_output=True, text=True)
-        if result.returncode != 0:
-            print("Tailwind build failed:", result.stderr.strip())
-            shutil.copy2(source, dest)
+        error = _run_tool(cmd)
+        if error is not None:
+            print("Tailwind build failed:", error)
+            _fast_copy(source, dest)
+        else:
+            _store_in_cache(dest, cache_file)
+            self._prune_cache(keep=cache_file)
 
         return True
 
+    def _prune_cache(self, keep: Path) -> None:
+        """Delete cached builds other than the latest one.
+
+        The key covers content file mtimes, so every page or template edit
+        produces a new entry; only the newest is worth keeping.
+
+        Args:
+            keep: Cache entry to keep.
+        """
+        for entry in self._cache_dir.glob("*.css"):
+            if entry != keep:
+                with contextlib.suppress(OSError):
+                    entry.unlink()
+
+    def _cache_key(
+        self,
+        source: Path,
+        tailwind_bin: str,
+        content: list[tuple[str, os.stat_result]],
+    ) -> str:
+        """Build the cache key for a Tailwind run.
+
+        Args:
+            source: Source CSS path (main.css).
+            tailwind_bin: Tailwind executable used for the build.
+            content: Content files with their stat results.
+
+        Returns:
+            Hex digest covering the input CSS and scanned content files.
+        """
+        entries = [tailwind_bin]
+        for path, stat in content:
+            entries.append(f"{path}:{stat.st_mtime_ns}:{stat.st_size}")
+        return _cache_key(
+            self.CACHE_VERSION, source.read_bytes(), "\n".join(entries).encode()
+        )
+
+    def _content_files(self) -> list[str]:
+        """List the files that influence the generated CSS.
+
+        Each content directory is walked once for all of its suffixes,
+        rather than once per glob. Stylesheets under CSS_SOURCES are
+        included so edits to @imported files invalidate the build.
+
+        Returns:
+            Sorted paths of content files and stylesheets, plus any
+            tailwind.config.* file.
+        """
+        files: list[str] = []
+        for base, suffixes in (*self.CONTENT_SOURCES, self.CSS_SOURCES):
+            for root, _dirs, names in os.walk(self.project_root / base):
+                files.extend(
+                    os.path.join(root, name)
+                    for name in names
+                    if name.endswith(suffixes)
+                )
+        files.extend(str(path) for path in self.project_root.glob("tailwind.config.*"))
+        files.sort()
+        return files
+
+    @cached_property
+    def _tailwind_bin(self) -> str | None:
+        """Tailwind executable, looked up once per processor."""
+        return self._find_executable("tailwindcss")
+
     def _find_executable(self, name: str) -> str | None:
         """Find an executable in PATH or node_modules.
 
@@ -223,21 +709,21 @@ class TailwindCSSProcessor(BaseAssetProcessor):
         Returns:
             Path to executable or None.
         """
-        found = shutil.which(name)
-        if found:
-            return found
-        local = self.project_root / "node_modules" / ".bin" / name
-        if local.exists():
-            return str(local)
-        return None
+        return find_executable_cached(name, self.project_root)
 
 
 class JSProcessor(BaseAssetProcessor):
     """Minifies JavaScript files.
 
     Uses rjsmin if available, falls back to terser, then to simple copying.
+    Minified output is cached under ``.medusa-cache/js`` keyed on a hash of
+    the source, so unchanged files skip minification on later builds.
     """
 
+    CACHE_VERSION = 1
+    HANDLED_SUFFIXES = frozenset({".js"})
+    priority = 80
+
     def __init__(self, project_root: Path):
         """Initialize the JS processor.
 
@@ -245,10 +731,8 @@ class JSProcessor(BaseAssetProcessor):
             project_root: Root directory of the project.
         """
         self.project_root = project_root
-
-    @property
-    def priority(self) -> int:
-        return 80
+        self._cache_dir = project_root / CACHE_DIR_NAME / "js"
+        self._minify_fn = jsmin
 
     def can_process(self, path: Path) -> bool:
         """Check if this is a JavaScript file."""
@@ -264,44 +748,46 @@ class JSProcessor(BaseAssetProcessor):
         Returns:
             True if processing was successful.
         """
-        dest.parent.mkdir(parents=True, exist_ok=True)
+        self.ensure_dest_dir(dest)
+
+        key = _file_cache_key(self.CACHE_VERSION, source)
+        cache_file = self._cache_dir / f"{key}.js"
+        if cache_file.exists():
+            _fast_copy(cache_file, dest)
+            return True
+        dest.unlink(missing_ok=True)
 
-        # Try rjsmin first
-        if jsmin is not None:
+        # Try rjsmin first; it minifies bytes directly, so the source is
+        # never decoded or re-encoded.
+        if self._minify_fn is not None:
             try:
-                with open(source, encoding="utf-8") as f_in:
-                    minified = jsmin(f_in.read())
-                with open(dest, "w", encoding="utf-8") as f_out:
-                    f_out.write(minified)
+                dest.write_bytes(self._minify_fn(source.read_bytes()))
+                _store_in_cache(dest, cache_file)
                 return True
             except Exception:
                 pass
 
         # Try terser
-        terser = self._find_executable("terser")
+        terser = self._terser_bin
         if terser:
-            result = subprocess.run(
-                [terser, str(source), "-c", "-m", "-o", str(dest)],
-                capture_output=True,
-                text=True,
-            )
-            if result.returncode == 0:
+            error = _run_tool([terser, str(source), "-c", "-m", "-o", str(dest)])
+            if error is None:
+                _store_in_cache(dest, cache_file)
                 return True
-            print("JS minification failed via terser:", result.stderr.strip())
+            print("JS minification failed via terser:", error)
 
         # Fallback: simple copy
-        shutil.copy2(source, dest)
+        _fast_copy(source, dest)
         return True
 
+    @cached_property
+    def _terser_bin(self) -> str | None:
+        """Terser executable, looked up once per processor."""
+        return self._find_executable("terser")
+
     def _find_executable(self, name: str) -> str | None:
         """Find an executable in PATH or node_modules."""
-        found = shutil.which(name)
-        if found:
-            return found
-        local = self.project_root / "node_modules" / ".bin" / name
-        if local.exists():
-            return str(local)
-        return None
+        return find_executable_cached(name, self.project_root)
 
 
 class StaticAssetProcessor(BaseAssetProcessor):
@@ -311,9 +797,7 @@ class StaticAssetProcessor(BaseAssetProcessor):
     special processing (fonts, SVGs, etc.).
     """
 
-    @property
-    def priority(self) -> int:
-        return 0  # Lowest priority - fallback
+    priority = 0  # Lowest priority - fallback
 
     def can_process(self, path: Path) -> bool:
         """Accept any file as a fallback."""
@@ -329,8 +813,8 @@ class StaticAssetProcessor(BaseAssetProcessor):
         Returns:
             True if processing was successful.
         """
-        dest.parent.mkdir(parents=True, exist_ok=True)
-        shutil.copy2(source, dest)
+        self.ensure_dest_dir(dest)
+        _fast_copy(source, dest)
         return True
 
 
@@ -345,6 +829,10 @@ class AssetProcessorRegistry:
     def __init__(self):
         """Initialize an empty registry."""
         self._processors: list[BaseAssetProcessor] = []
+        # File suffix -> processors that may handle it, by priority
+        self._by_suffix: dict[str, tuple[BaseAssetProcessor, ...]] = {}
+        # Output directories already created during this registry's lifetime
+        self._known_dirs: set[Path] = set()
 
     def register(self, processor: BaseAssetProcessor) -> None:
         """Register a new processor.
@@ -354,8 +842,44 @@ class AssetProcessorRegistry:
         Args:
             processor: Asset processor to register.
         """
+        processor.known_dirs = self._known_dirs
         self._processors.append(processor)
         self._processors.sort(key=lambda p: p.priority, reverse=True)
+        self._by_suffix.clear()
+
+    def ensure_dir(self, directory: Path) -> None:
+        """Create an output directory once for all registered processors.
+
+        Args:
+            directory: Directory to create (with parents).
+        """
+        if directory not in self._known_dirs:
+            directory.mkdir(parents=True, exist_ok=True)
+            self._known_dirs.add(directory)
+
+    def _candidates(self, suffix: str) -> tuple[BaseAssetProcessor, ...]:
+        """Return the processors that may handle a suffix, by priority.
+
+        The table is keyed by the suffix as written, so the common case
+        is a single dict lookup; case folding only happens on a miss.
+
+        Args:
+            suffix: File suffix in any case (e.g., ".png" or ".PNG").
+
+        Returns:
+            Processors whose HANDLED_SUFFIXES include suffix or are unset.
+        """
+        candidates = self._by_suffix.get(suffix)
+        if candidates is None:
+            lowered = suffix.lower()
+            candidates = tuple(
+                p
+                for p in self._processors
+                if (handled := getattr(p, "HANDLED_SUFFIXES", None)) is None
+                or lowered in handled
+            )
+            self._by_suffix[suffix] = candidates
+        return candidates
 
     def get_processor(self, path: Path) -> BaseAssetProcessor | None:
         """Get the appropriate processor for a file.
@@ -366,7 +890,7 @@ class AssetProcessorRegistry:
         Returns:
             The first processor that can handle the file, or None.
         """
-        for processor in self._processors:
+        for processor in self._candidates(path.suffix):
             if processor.can_process(path):
                 return processor
         return None
@@ -400,7 +924,7 @@ def create_default_registry(
         Configured AssetProcessorRegistry.
     """
     registry = AssetProcessorRegistry()
-    registry.register(ImageProcessor())
+    registry.register(ImageProcessor(project_root))
     registry.register(TailwindCSSProcessor(project_root, output_dir))
     registry.register(CSSProcessor())
     registry.register(JSProcessor(project_root))
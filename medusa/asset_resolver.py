@@ -10,6 +10,7 @@ Key classes:
 
 from __future__ import annotations
 
+import posixpath
 from collections.abc import Callable
 from pathlib import Path
 
@@ -45,6 +46,12 @@ class DefaultAssetPathResolver:
     their URL paths. It follows the Single Responsibility Principle -
     only handles asset path resolution.
 
+    Asset directories are listed once and kept in memory, so repeated
+    lookups of existing assets never touch the filesystem. Names the
+    listing cannot match exactly (another case on a case-insensitive
+    filesystem, a file added since the listing) fall back to a stat.
+    Call invalidate() to forget listings and memoized lookups.
+
     Attributes:
         site_dir: Directory containing site content.
         url_generator: Function to generate URLs with root_url prefix.
@@ -53,6 +60,8 @@ class DefaultAssetPathResolver:
     # Supported extensions for auto-detection
     IMAGE_EXTENSIONS = ("png", "jpg", "jpeg", "gif", "svg", "webp")
     FONT_EXTENSIONS = ("woff2", "woff", "ttf", "otf", "eot")
+    _IMAGE_SUFFIXES = tuple(f".{ext}" for ext in IMAGE_EXTENSIONS)
+    _FONT_SUFFIXES = tuple(f".{ext}" for ext in FONT_EXTENSIONS)
 
     def __init__(
         self, site_dir: Path, url_generator: Callable[[str], str] | None = None
@@ -66,6 +75,9 @@ class DefaultAssetPathResolver:
         self.site_dir = site_dir
         self.assets_dir = site_dir.parent / "assets"
         self._url_generator = url_generator or (lambda x: x)
+        self._listings: dict[str, frozenset[str]] = {}
+        # (asset_type, name) -> URL, or the arguments of the miss's error
+        self._resolved: dict[tuple[str, str], str | tuple[str, str, list[Path]]] = {}
 
     def set_url_generator(self, url_generator: Callable[[str], str]) -> None:
         """Set the URL generator function.
@@ -74,10 +86,54 @@ class DefaultAssetPathResolver:
             url_generator: Function to generate URLs with root_url prefix.
         """
         self._url_generator = url_generator
+        self._resolved.clear()
+
+    def invalidate(self) -> None:
+        """Forget cached listings and lookups so new assets are picked up."""
+        self._listings.clear()
+        self._resolved.clear()
+
+    def _listing(self, subdir: str) -> frozenset[str]:
+        """Return the files under an asset subdirectory.
+
+        Args:
+            subdir: Asset subdirectory name (e.g., "images").
+
+        Returns:
+            Set of file paths relative to the subdirectory, in POSIX form.
+        """
+        listing = self._listings.get(subdir)
+        if listing is None:
+            base = self.assets_dir / subdir
+            listing = frozenset(
+                path.relative_to(base).as_posix()
+                for path in base.rglob("*")
+                if path.is_file()
+            )
+            self._listings[subdir] = listing
+        return listing
+
+    def _has_file(self, subdir: str, name: str) -> bool:
+        """Check whether an asset file exists.
+
+        Args:
+            subdir: Asset subdirectory name (e.g., "images").
+            name: File path relative to the subdirectory.
+
+        Returns:
+            True if the file exists.
+        """
+        # normpath folds spellings like "./x.png" and "sub//x.png"
+        if posixpath.normpath(name) in self._listing(subdir):
+            return True
+        return (self.assets_dir / subdir / name).exists()
 
     def resolve(self, name: str, asset_type: str) -> str:
         """Resolve an asset name to its URL path.
 
+        Results are memoized per (asset_type, name) until the URL generator
+        changes or invalidate() is called.
+
         Args:
             name: Asset filename (with or without extension).
             asset_type: Type of asset ('js', 'css', 'image', 'font').
@@ -88,16 +144,32 @@ class DefaultAssetPathResolver:
         Raises:
             AssetNotFoundError: If the asset doesn't exist.
         """
-        if asset_type == "js":
-            return self._resolve_js(name)
-        elif asset_type == "css":
-            return self._resolve_css(name)
-        elif asset_type == "image":
-            return self._resolve_image(name)
-        elif asset_type == "font":
-            return self._resolve_font(name)
-        else:
-            raise ValueError(f"Unknown asset type: {asset_type}")
+        key = (asset_type, name)
+        cached = self._resolved.get(key)
+        if cached is None:
+            if asset_type == "js":
+                resolver = self._resolve_js
+            elif asset_type == "css":
+                resolver = self._resolve_css
+            elif asset_type == "image":
+                resolver = self._resolve_image
+            elif asset_type == "font":
+                resolver = self._resolve_font
+            else:
+                raise ValueError(f"Unknown asset type: {asset_type}")
+            # Misses are cached too, so a missing asset referenced from
+            # every page is only searched for once. Only the error's
+            # arguments are kept: pages render concurrently, and a shared
+            # exception instance would have its traceback and context
+            # overwritten by each raise.
+            try:
+                cached = resolver(name)
+            except AssetNotFoundError as exc:
+                cached = (exc.asset_name, exc.asset_type, exc.searched_paths)
+            self._resolved[key] = cached
+        if isinstance(cached, tuple):
+            raise AssetNotFoundError(*cached)
+        return cached
 
     def js_path(self, name: str) -> str:
         """Return URL path for a JavaScript file.
@@ -111,7 +183,7 @@ class DefaultAssetPathResolver:
         Raises:
             AssetNotFoundError: If the JavaScript file doesn't exist.
         """
-        return self._resolve_js(name)
+        return self.resolve(name, "js")
 
     def css_path(self, name: str) -> str:
         """Return URL path for a CSS file.
@@ -125,7 +197,7 @@ class DefaultAssetPathResolver:
         Raises:
             AssetNotFoundError: If the CSS file doesn't exist.
         """
-        return self._resolve_css(name)
+        return self.resolve(name, "css")
 
     def img_path(self, name: str) -> str:
         """Return URL path for an image file, auto-detecting extension.
@@ -142,7 +214,7 @@ class DefaultAssetPathResolver:
         Raises:
             AssetNotFoundError: If no matching image file is found.
         """
-        return self._resolve_image(name)
+        return self.resolve(name, "image")
 
     def font_path(self, name: str) -> str:
         """Return URL path for a font file, auto-detecting extension.
@@ -159,14 +231,14 @@ class DefaultAssetPathResolver:
         Raises:
             AssetNotFoundError: If no matching font file is found.
         """
-        return self._resolve_font(name)
+        return self.resolve(name, "font")
 
     def _resolve_js(self, name: str) -> str:
         """Resolve JavaScript file path."""
         if not name.endswith(".js"):
             name = f"{name}.js"
-        file_path = self.assets_dir / "js" / name
-        if not file_path.exists():
+        if not self._has_file("js", name):
+            file_path = self.assets_dir / "js" / name
             raise AssetNotFoundError(name, "JavaScript", [file_path])
         return self._url_generator(f"/assets/js/{name}")
 
@@ -174,51 +246,58 @@ class DefaultAssetPathResolver:
         """Resolve CSS file path."""
         if not name.endswith(".css"):
             name = f"{name}.css"
-        file_path = self.assets_dir / "css" / name
-        if not file_path.exists():
+        if not self._has_file("css", name):
+            file_path = self.assets_dir / "css" / name
             raise AssetNotFoundError(name, "CSS", [file_path])
         return self._url_generator(f"/assets/css/{name}")
 
     def _resolve_image(self, name: str) -> str:
         """Resolve image file path with auto-detection."""
-        assets_dir = self.assets_dir / "images"
+        return self._resolve_with_extensions(
+            name, "images", "image", self.IMAGE_EXTENSIONS, self._IMAGE_SUFFIXES
+        )
 
-        # If already has a known image extension, validate it exists
-        for ext in self.IMAGE_EXTENSIONS:
-            if name.endswith(f".{ext}"):
-                file_path = assets_dir / name
-                if not file_path.exists():
-                    raise AssetNotFoundError(name, "image", [file_path])
-                return self._url_generator(f"/assets/images/{name}")
+    def _resolve_font(self, name: str) -> str:
+        """Resolve font file path with auto-detection."""
+        return self._resolve_with_extensions(
+            name, "fonts", "font", self.FONT_EXTENSIONS, self._FONT_SUFFIXES
+        )
 
-        # Auto-detect extension
-        searched_paths = []
-        for ext in self.IMAGE_EXTENSIONS:
-            file_path = assets_dir / f"{name}.{ext}"
-            searched_paths.append(file_path)
-            if file_path.exists():
-                return self._url_generator(f"/assets/images/{name}.{ext}")
+    def _resolve_with_extensions(
+        self,
+        name: str,
+        subdir: str,
+        label: str,
+        extensions: tuple[str, ...],
+        suffixes: tuple[str, ...],
+    ) -> str:
+        """Resolve a file path, auto-detecting its extension if omitted.
 
-        raise AssetNotFoundError(name, "image", searched_paths)
+        Args:
+            name: Filename with or without extension.
+            subdir: Asset subdirectory to search (e.g., "images").
+            label: Asset type used in error messages.
+            extensions: Extensions to try, in order, without the dot.
+            suffixes: The same extensions with a leading dot.
 
-    def _resolve_font(self, name: str) -> str:
-        """Resolve font file path with auto-detection."""
-        assets_dir = self.assets_dir / "fonts"
+        Returns:
+            URL path to the asset.
 
-        # If already has a known font extension, validate it exists
-        for ext in self.FONT_EXTENSIONS:
-            if name.endswith(f".{ext}"):
-                file_path = assets_dir / name
-                if not file_path.exists():
-                    raise AssetNotFoundError(name, "font", [file_path])
-                return self._url_generator(f"/assets/fonts/{name}")
+        Raises:
+            AssetNotFoundError: If no matching file is found.
+        """
+        # If already has a known extension, validate it exists
+        if name.endswith(suffixes):
+            if not self._has_file(subdir, name):
+                raise AssetNotFoundError(name, label, [self.assets_dir / subdir / name])
+            return self._url_generator(f"/assets/{subdir}/{name}")
 
         # Auto-detect extension
-        searched_paths = []
-        for ext in self.FONT_EXTENSIONS:
-            file_path = assets_dir / f"{name}.{ext}"
-            searched_paths.append(file_path)
-            if file_path.exists():
-                return self._url_generator(f"/assets/fonts/{name}.{ext}")
-
-        raise AssetNotFoundError(name, "font", searched_paths)
+        for suffix in suffixes:
+            candidate = name + suffix
+            if self._has_file(subdir, candidate):
+                return self._url_generator(f"/assets/{subdir}/{candidate}")
+
+        assets_dir = self.assets_dir / subdir
+        searched_paths = [assets_dir / f"{name}.{ext}" for ext in extensions]
+        raise AssetNotFoundError(name, label, searched_paths)
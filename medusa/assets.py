@@ -15,7 +15,8 @@ Design principles:
 
 from __future__ import annotations
 
-import shutil
+import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 from .asset_processors import (
@@ -23,6 +24,7 @@ from .asset_processors import (
     JSProcessor,
     TailwindCSSProcessor,
     create_default_registry,
+    find_executable,
 )
 
 # Keep these imports for backward compatibility
@@ -37,6 +39,19 @@ except ImportError:  # pragma: no cover
     Image = None
 
 
+def _default_max_workers() -> int:
+    """Return the default asset thread pool size.
+
+    Asset work is dominated by file I/O, image codecs and minifier
+    subprocesses, all of which release the GIL, so the pool is sized
+    well above the core count (capped at 32).
+
+    Returns:
+        Number of worker threads.
+    """
+    return min(32, (os.cpu_count() or 1) * 4)
+
+
 class AssetPipeline:
     """Handles the processing and optimization of static assets for the site.
 
@@ -52,6 +67,7 @@ class AssetPipeline:
         assets_dir (Path): Directory containing source assets.
         output_dir (Path): Directory where processed assets are written.
         processor_registry (AssetProcessorRegistry): Registry of asset processors.
+        max_workers (int): Thread pool size for asset processing.
     """
 
     def __init__(
@@ -59,6 +75,7 @@ class AssetPipeline:
         project_root: Path,
         output_dir: Path,
         processor_registry: AssetProcessorRegistry | None = None,
+        max_workers: int | None = None,
     ):
         """Initialize the asset pipeline.
 
@@ -66,10 +83,13 @@ class AssetPipeline:
             project_root: Root directory of the Medusa project.
             output_dir: Directory where built assets will be placed.
             processor_registry: Optional custom processor registry.
+            max_workers: Optional thread pool size (defaults to four
+                threads per CPU, at most 32).
         """
         self.project_root = project_root
         self.assets_dir = project_root / "assets"
         self.output_dir = output_dir
+        self.max_workers = max_workers or _default_max_workers()
         self.processor_registry = processor_registry or create_default_registry(
             project_root, output_dir
         )
@@ -78,6 +98,9 @@ class AssetPipeline:
         """Execute the asset processing pipeline.
 
         This method processes all assets using the registered processors.
+        Files are independent, so they are processed concurrently on a
+        thread pool; copies, image encoding and minifier subprocesses all
+        spend most of their time outside the GIL.
         It handles Tailwind CSS separately to ensure proper content scanning.
         """
         if not self.assets_dir.exists():
@@ -85,23 +108,50 @@ class AssetPipeline:
 
         target = self.output_dir / "assets"
         target.mkdir(parents=True, exist_ok=True)
+        files = self._collect_assets(target)
 
         # Process all assets through the registry
-        for item in self.assets_dir.rglob("*"):
-            if item.is_dir():
-                continue
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            list(executor.map(lambda item: self._process_one(item, target), files))
+
+        # Process Tailwind CSS separately (needs special handling)
+        self._process_tailwind()
+
+    def _collect_assets(self, target: Path) -> list[Path]:
+        """List asset files and create their output directories.
 
-            rel = item.relative_to(self.assets_dir)
-            dest = target / rel
+        Walks assets_dir once with os.walk and creates each output
+        directory a single time through the registry, so processors
+        skip the per-file mkdir for directories created here.
 
+        Args:
+            target: Output assets directory.
+
+        Returns:
+            Paths of asset files to process (main.css excluded).
+        """
+        files: list[Path] = []
+        for root, _dirs, names in os.walk(self.assets_dir):
             # Skip main.css - handled specially by TailwindCSSProcessor
-            if item.suffix == ".css" and item.name == "main.css":
-                continue
+            batch = [Path(root, name) for name in names if name != "main.css"]
+            if batch:
+                rel_root = os.path.relpath(root, self.assets_dir)
+                self.processor_registry.ensure_dir(target / rel_root)
+                files.extend(batch)
+        return files
 
-            self.processor_registry.process(item, dest)
+    def _process_one(self, item: Path, target: Path) -> bool:
+        """Process a single asset into the target directory.
 
-        # Process Tailwind CSS separately (needs special handling)
-        self._process_tailwind()
+        Args:
+            item: Source asset path.
+            target: Output assets directory.
+
+        Returns:
+            True if processing was successful.
+        """
+        dest = target / item.relative_to(self.assets_dir)
+        return self.processor_registry.process(item, dest)
 
     def _process_tailwind(self) -> None:
         """Process Tailwind CSS using the dedicated processor.
@@ -128,14 +178,8 @@ class AssetPipeline:
         """
         target = self.output_dir / "assets"
         target.mkdir(parents=True, exist_ok=True)
-        for item in self.assets_dir.rglob("*"):
-            if item.is_dir():
-                continue
-            rel = item.relative_to(self.assets_dir)
-            dest = target / rel
-            if item.suffix == ".css" and item.name == "main.css":
-                continue
-            self.processor_registry.process(item, dest)
+        for item in self._collect_assets(target):
+            self._process_one(item, target)
 
     def _minify_js(self) -> None:
         """Minify JavaScript files using the JS processor.
@@ -145,20 +189,15 @@ class AssetPipeline:
         """
         js_processor = JSProcessor(self.project_root)
         target = self.output_dir / "assets"
-        for js_file in self.assets_dir.rglob("*.js"):
-            rel = js_file.relative_to(self.assets_dir)
-            dest = target / rel
-            js_processor.process(js_file, dest)
+        for js_file in self._collect_assets(target):
+            if js_file.suffix == ".js":
+                js_processor.process(
+                    js_file, target / js_file.relative_to(self.assets_dir)
+                )
 
     def _find_executable(self, name: str) -> str | None:  # pragma: no cover
         """Find an executable in PATH or local node_modules.
 
         Deprecated: Each processor now handles its own executable discovery.
         """
-        found = shutil.which(name)
-        if found:
-            return found
-        local = self.project_root / "node_modules" / ".bin" / name
-        if local.exists():
-            return str(local)
-        return None
+        return find_executable(name, self.project_root)
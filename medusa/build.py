@@ -17,20 +17,30 @@ Design principles:
 
 from __future__ import annotations
 
+import os
 from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from datetime import datetime, timezone
+from datetime import date, datetime, timezone
+from functools import lru_cache
+from operator import attrgetter
 from pathlib import Path
 from typing import Any
+from xml.sax.saxutils import escape
 
-import yaml
 from jinja2 import TemplateSyntaxError
 
+from .asset_processors import CACHE_DIR_NAME, clear_asset_cache
 from .asset_resolver import AssetNotFoundError
 from .assets import AssetPipeline
 from .content import ContentProcessor, Page
 from .templates import TemplateEngine
-from .utils import absolutize_html_urls, build_tags_index, ensure_clean_dir
+from .utils import (
+    absolutize_html_urls,
+    build_tags_index,
+    ensure_clean_dir,
+    load_yaml,
+)
 
 
 class BuildError(Exception):
@@ -89,7 +99,7 @@ def load_config(project_root: Path) -> dict[str, Any]:
     config = DEFAULT_CONFIG.copy()
     if config_path.exists():
         with open(config_path, encoding="utf-8") as f:
-            loaded = yaml.safe_load(f) or {}
+            loaded = load_yaml(f) or {}
             if isinstance(loaded, dict):
                 config.update(loaded)
     return config
@@ -108,9 +118,14 @@ def load_data(project_root: Path) -> dict[str, Any]:
     data: dict[str, Any] = {}
     if not data_dir.exists():
         return data
-    for path in sorted(data_dir.glob("*.yaml")):
-        with open(path, encoding="utf-8") as f:
-            payload = yaml.safe_load(f) or {}
+    paths = sorted(data_dir.glob("*.yaml"))
+    # Read and parse files concurrently, then merge in sorted order so
+    # later files still override earlier ones deterministically.
+    with ThreadPoolExecutor() as executor:
+        payloads = list(
+            executor.map(lambda path: load_yaml(path.read_bytes()) or {}, paths)
+        )
+    for path, payload in zip(paths, payloads, strict=True):
         if not isinstance(payload, dict):
             continue
         if path.name == "site.yaml":
@@ -126,6 +141,7 @@ def build_site(
     root_url: str | None = None,
     clean_output: bool = True,
     output_dir_override: Path | None = None,
+    use_cache: bool = True,
 ) -> BuildResult:
     """Build the entire static site.
 
@@ -135,6 +151,8 @@ def build_site(
         root_url: Optional base URL to absolutize links with.
         clean_output: Whether to wipe the output directory before building.
         output_dir_override: Optional path to write the build output instead of config output_dir.
+        use_cache: Whether to reuse processed assets and rendered markdown
+            cached by earlier builds.
 
     Returns:
         BuildResult containing all pages, output directory, and site data.
@@ -157,42 +175,70 @@ def build_site(
     site_dir = project_root / "site"
     if not site_dir.exists():
         raise FileNotFoundError(f"Expected site directory at {site_dir}")
-    pages = ContentProcessor(site_dir).load(include_drafts=include_drafts)
+    if not use_cache:
+        clear_asset_cache(project_root)
+    pages = ContentProcessor(
+        site_dir, cache_dir=project_root / CACHE_DIR_NAME / "render"
+    ).load(include_drafts=include_drafts)
     tags = build_tags_index(pages)
-
     engine = TemplateEngine(site_dir, data, root_url=resolved_root)
     engine.update_collections(pages, tags)
-    for page in pages:
-        try:
-            rendered = engine.render_page(page)
-        except TemplateSyntaxError as exc:
-            raise BuildError(
-                page.path,
-                f"Template syntax error on line {exc.lineno}: {exc.message}",
-                exc,
-            ) from exc
-        except AssetNotFoundError as exc:
-            raise BuildError(
-                page.path,
-                f"Missing {exc.asset_type} asset: '{exc.asset_name}'",
-                exc,
-            ) from exc
-        except Exception as exc:
-            raise BuildError(
-                page.path,
-                _format_error_message(exc),
-                exc,
-            ) from exc
-        if resolved_root:
-            rendered = absolutize_html_urls(rendered, resolved_root)
-        _write_page(output_dir, page, rendered)
-
-    AssetPipeline(project_root, output_dir).run()
+    # Assets (including the Tailwind CLI, which scans sources rather than
+    # rendered pages) don't depend on rendering, so build them meanwhile.
+    with ThreadPoolExecutor(max_workers=1) as asset_executor:
+        assets = asset_executor.submit(AssetPipeline(project_root, output_dir).run)
+        _make_page_dirs(output_dir, pages)
+        # Pages render serially: Jinja rendering holds the GIL, so worker
+        # threads gained nothing measurable and would share the page
+        # collection caches. Each page is written as soon as it is rendered,
+        # so HTML never queues up in memory.
+        for page in pages:
+            _write_page(output_dir, page, _render_page(engine, page, resolved_root))
+        assets.result()
     _write_sitemap(output_dir, data, pages)
     _write_rss(output_dir, data, pages)
     return BuildResult(pages=pages, output_dir=output_dir, data=data)
 
 
+def _render_page(engine: TemplateEngine, page: Page, resolved_root: str) -> str:
+    """Render a single page, wrapping failures in BuildError.
+
+    Args:
+        engine: Template engine with collections installed.
+        page: Page to render.
+        resolved_root: Base URL to absolutize links with, or "".
+
+    Returns:
+        Rendered HTML for the page.
+
+    Raises:
+        BuildError: If rendering fails.
+    """
+    try:
+        rendered = engine.render_page(page)
+    except TemplateSyntaxError as exc:
+        raise BuildError(
+            page.path,
+            f"Template syntax error on line {exc.lineno}: {exc.message}",
+            exc,
+        ) from exc
+    except AssetNotFoundError as exc:
+        raise BuildError(
+            page.path,
+            f"Missing {exc.asset_type} asset: '{exc.asset_name}'",
+            exc,
+        ) from exc
+    except Exception as exc:
+        raise BuildError(
+            page.path,
+            _format_error_message(exc),
+            exc,
+        ) from exc
+    if resolved_root:
+        rendered = absolutize_html_urls(rendered, resolved_root)
+    return rendered
+
+
 def _format_error_message(exc: Exception) -> str:
     """Format an exception into a user-friendly error message.
 
@@ -219,17 +265,79 @@ def _format_error_message(exc: Exception) -> str:
 def _write_page(output_dir: Path, page: Page, rendered: str) -> None:
     """Write a rendered page to the output directory.
 
+    The page's directory must already exist; see _make_page_dirs().
+
     Args:
         output_dir: Base output directory.
         page: Page object containing metadata.
         rendered: Rendered HTML content.
     """
-    url_path = page.url.strip("/")
-    target_dir = output_dir / url_path
-    target_dir.mkdir(parents=True, exist_ok=True)
-    html_path = target_dir / "index.html"
-    with open(html_path, "w", encoding="utf-8") as f:
-        f.write(rendered)
+    html_path = output_dir / page.url.strip("/") / "index.html"
+    _write_bytes(html_path, rendered.encode("utf-8"))
+
+
+# Flags for _write_bytes; O_BINARY only exists (and matters) on Windows
+_WRITE_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+
+
+def _write_bytes(path: Path, data: bytes) -> None:
+    """Write data to path with raw os.open/os.write calls.
+
+    Skips the buffered file object (and the fstat it does to size its
+    buffer) that Path.write_bytes creates for every page.
+
+    Args:
+        path: File to create or truncate.
+        data: Bytes to write.
+    """
+    fd = os.open(path, _WRITE_FLAGS, 0o666)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view) :]
+    finally:
+        os.close(fd)
+
+
+def _make_page_dirs(output_dir: Path, pages: Iterable[Page]) -> None:
+    """Create every page's output directory once, parents first.
+
+    Args:
+        output_dir: Base output directory.
+        pages: Pages that will be written.
+    """
+    dirs = {output_dir / page.url.strip("/") for page in pages}
+    for target_dir in sorted(dirs, key=lambda path: len(path.parts)):
+        target_dir.mkdir(parents=True, exist_ok=True)
+
+
+@lru_cache(maxsize=4096)
+def _format_lastmod(day: date) -> str:
+    """Format a sitemap lastmod date, memoized since many pages share a day.
+
+    Args:
+        day: Date to format.
+
+    Returns:
+        Date as YYYY-MM-DD.
+    """
+    return day.strftime("%Y-%m-%d")
+
+
+_RFC822_FORMAT = "%a, %d %b %Y %H:%M:%S +0000"
+
+
+@lru_cache(maxsize=4096)
+def _format_rfc822(moment: datetime) -> str:
+    """Format an RSS date, memoized since dated posts often share a timestamp.
+
+    Args:
+        moment: Datetime to format.
+
+    Returns:
+        Date in RFC 822 form as used by RSS.
+    """
+    return moment.strftime(_RFC822_FORMAT)
 
 
 def _write_sitemap(
@@ -245,45 +353,47 @@ def _write_sitemap(
     base_url = str(data.get("url", "")).rstrip("/")
     if not base_url:
         return
-    lines = [
-        '<?xml version="1.0" encoding="UTF-8"?>',
-        '<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">',
-    ]
-    for page in pages:
-        full_url = f"{base_url}{page.url}"
-        lastmod = page.date.strftime("%Y-%m-%d")
-        lines.append(f"  <url><loc>{full_url}</loc><lastmod>{lastmod}</lastmod></url>")
-    lines.append("</urlset>")
-    (output_dir / "sitemap.xml").write_text("\n".join(lines), encoding="utf-8")
-
-
-def _write_rss(output_dir: Path, data: dict[str, Any], pages: Iterable[Page]) -> None:
+    # Stream entries to the file rather than joining one large string
+    with open(output_dir / "sitemap.xml", "w", encoding="utf-8") as f:
+        f.write('<?xml version="1.0" encoding="UTF-8"?>\n')
+        f.write('<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">')
+        base_url = escape(base_url)
+        for page in pages:
+            full_url = f"{base_url}{escape(page.url)}"
+            lastmod = _format_lastmod(page.date.date())
+            f.write(f"\n  <url><loc>{full_url}</loc><lastmod>{lastmod}</lastmod></url>")
+        f.write("\n</urlset>")
+
+
+def _write_rss(output_dir: Path, data: dict[str, Any], pages: list[Page]) -> None:
     """Generate and write rss.xml feed.
 
     Args:
         output_dir: Output directory for the RSS feed.
         data: Site data dictionary.
-        pages: Iterable of all pages.
+        pages: List of all pages.
     """
     base_url = str(data.get("url", "")).rstrip("/")
     title = data.get("title", "Medusa Feed")
     if not base_url:
         return
-    items = []
-    for page in sorted(pages, key=lambda p: p.date, reverse=True):
-        link = f"{base_url}{page.url}"
-        pub_date = page.date.strftime("%a, %d %b %Y %H:%M:%S +0000")
-        description = page.description or page.title
-        items.append(
-            f"<item><title>{page.title}</title><link>{link}</link><description>{description}</description><pubDate>{pub_date}</pubDate></item>"
-        )
-    rss = [
-        '<?xml version="1.0" encoding="UTF-8"?>',
-        '<rss version="2.0"><channel>',
-        f"<title>{title}</title>",
-        f"<link>{base_url}</link>",
-        f"<lastBuildDate>{datetime.now(timezone.utc).strftime('%a, %d %b %Y %H:%M:%S +0000')}</lastBuildDate>",
-    ]
-    rss.extend(items)
-    rss.append("</channel></rss>")
-    (output_dir / "rss.xml").write_text("\n".join(rss), encoding="utf-8")
+    # Unique per build, so formatted directly rather than through the
+    # memoized page-date helper, where it would only evict real entries
+    last_build = datetime.now(timezone.utc).strftime(_RFC822_FORMAT)
+    # Stream items to the file rather than joining one large string
+    with open(output_dir / "rss.xml", "w", encoding="utf-8") as f:
+        f.write('<?xml version="1.0" encoding="UTF-8"?>\n')
+        f.write('<rss version="2.0"><channel>\n')
+        base_url = escape(base_url)
+        f.write(f"<title>{escape(str(title))}</title>\n")
+        f.write(f"<link>{base_url}</link>\n")
+        f.write(f"<lastBuildDate>{last_build}</lastBuildDate>")
+        for page in sorted(pages, key=attrgetter("date"), reverse=True):
+            link = f"{base_url}{escape(page.url)}"
+            pub_date = _format_rfc822(page.date)
+            item_title = escape(page.title)
+            description = escape(page.description) if page.description else item_title
+            f.write(
+                f"\n<item><title>{item_title}</title><link>{link}</link><description>{description}</description><pubDate>{pub_date}</pubDate></item>"
+            )
+        f.write("\n</channel></rss>")
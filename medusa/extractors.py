@@ -14,21 +14,25 @@ Key classes:
 from __future__ import annotations
 
 import re
+from collections.abc import Iterable
 from datetime import datetime
+from itertools import chain
 from pathlib import Path
 from typing import Any
 
-import yaml
-
 from .utils import (
     extract_date_from_name,
     extract_tags,
-    first_paragraph,
+    iter_paragraphs,
+    load_yaml_mapping,
     strip_hashtags,
+    summarize_paragraph,
     titleize,
 )
 
 FRONTMATTER_RE = re.compile(r"^---\s*\n(.*?)\n---\s*\n", re.DOTALL)
+# First "# " heading line with some text after the marker
+H1_RE = re.compile(r"^[ \t]*# [ \t]*(\S.*)$", re.MULTILINE)
 
 
 def extract_frontmatter(text: str) -> tuple[dict[str, Any], str]:
@@ -40,16 +44,18 @@ def extract_frontmatter(text: str) -> tuple[dict[str, Any], str]:
     Returns:
         Tuple of (frontmatter dict, remaining content).
     """
+    if not text.startswith("---"):
+        return {}, text
     match = FRONTMATTER_RE.match(text)
     if not match:
         return {}, text
-    try:
-        data = yaml.safe_load(match.group(1)) or {}
-        if not isinstance(data, dict):
-            return {}, text
-        return data, text[match.end() :]
-    except yaml.YAMLError:
+    if not match.group(1).strip():
+        # Blank block: nothing for YAML to parse
+        return {}, text[match.end() :]
+    data = load_yaml_mapping(match.group(1))
+    if data is None:
         return {}, text
+    return data, text[match.end() :]
 
 
 class TitleExtractor:
@@ -69,10 +75,9 @@ class TitleExtractor:
         Returns:
             Dictionary with 'title' key.
         """
-        for line in content.splitlines():
-            stripped = line.strip()
-            if stripped.startswith("# "):
-                return {"title": stripped.lstrip("# ").strip()}
+        match = H1_RE.search(content)
+        if match:
+            return {"title": match.group(1).lstrip("# ").strip()}
         return {"title": titleize(path.name)}
 
 
@@ -135,9 +140,16 @@ class DescriptionExtractor:
         Returns:
             Dictionary with 'description' and 'excerpt' keys.
         """
-        cleaned = strip_hashtags(content)
-        description = first_paragraph(cleaned)
-        excerpt = self._extract_excerpt(cleaned) if path.suffix.lower() == ".md" else ""
+        # Both values come from the leading paragraphs, so one lazy
+        # paragraph scan serves both and the rest of the body is never split.
+        paragraphs = iter_paragraphs(strip_hashtags(content))
+        first = next(paragraphs, None)
+        if first is None:
+            return {"description": "", "excerpt": ""}
+        description = summarize_paragraph(first)
+        excerpt = ""
+        if path.suffix.lower() == ".md":
+            excerpt = self._excerpt_from(chain((first,), paragraphs))
         return {"description": description, "excerpt": excerpt}
 
     def _extract_excerpt(self, text: str) -> str:
@@ -151,7 +163,19 @@ class DescriptionExtractor:
         Returns:
             The first paragraph as plain text.
         """
-        paragraphs = [p.strip() for p in text.split("\n\n") if p.strip()]
+        return self._excerpt_from(iter_paragraphs(text))
+
+    @staticmethod
+    def _excerpt_from(paragraphs: Iterable[str]) -> str:
+        """Pick the excerpt from stripped, non-empty paragraphs.
+
+        Args:
+            paragraphs: Paragraphs in document order.
+
+        Returns:
+            The first paragraph that is not a heading, image, code fence or
+            rule, whitespace-collapsed, or empty string.
+        """
         for para in paragraphs:
             if para.startswith("#"):
                 continue
@@ -221,7 +245,11 @@ class CompositeMetadataExtractor:
         """Extract all metadata from content.
 
         Runs all registered extractors and merges their results.
-        Later extractors can override earlier ones.
+        Later extractors can override earlier ones. Once an extractor
+        returns a 'body' (the frontmatter extractor does), the extractors
+        after it receive that body instead of the raw content, so the
+        frontmatter block is not scanned again for titles, tags and
+        descriptions.
 
         Args:
             content: Source content.
@@ -234,6 +262,7 @@ class CompositeMetadataExtractor:
         for extractor in self._extractors:
             extracted = extractor.extract(content, path)
             result.update(extracted)
+            content = extracted.get("body", content)
         return result
 
 
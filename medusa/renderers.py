@@ -13,17 +13,37 @@ Key classes:
 from __future__ import annotations
 
 import re
+import threading
+from functools import lru_cache
 from pathlib import Path
 from typing import TYPE_CHECKING
 
 import mistune
 
-from .utils import strip_hashtags
+from . import __version__
+
+# The pygments package itself is tiny; its lexers and formatters (which pull
+# in plugin discovery) are imported on the first code block.
+try:
+    import pygments
+except ImportError:  # pragma: no cover - pygments is optional at runtime
+    pygments = None
+
+# Identifies the code that shapes rendered markdown, for output caches.
+# Medusa's own version covers its heading ids, image paths and hashtags.
+RENDERER_FINGERPRINT = (
+    f"medusa-{__version__}|mistune-{mistune.__version__}"
+    f"|pygments-{getattr(pygments, '__version__', '')}"
+)
 
 if TYPE_CHECKING:
     pass
 
 
+_HEADING_ID_STRIP_RE = re.compile(r"[^\w\s-]")
+_HEADING_ID_DASH_RE = re.compile(r"[-\s]+")
+
+
 def _generate_heading_id(text: str) -> str:
     """Generate a URL-friendly ID from heading text.
 
@@ -33,10 +53,8 @@ def _generate_heading_id(text: str) -> str:
     Returns:
         URL-friendly slug suitable for anchor links.
     """
-    slug = text.lower().strip()
-    slug = re.sub(r"[^\w\s-]", "", slug)
-    slug = re.sub(r"[-\s]+", "-", slug)
-    return slug.strip("-")
+    slug = _HEADING_ID_STRIP_RE.sub("", text.lower().strip())
+    return _HEADING_ID_DASH_RE.sub("-", slug).strip("-")
 
 
 def _rewrite_image_path(src: str, folder: str) -> str:
@@ -51,9 +69,41 @@ def _rewrite_image_path(src: str, folder: str) -> str:
     """
     if src.startswith(("http://", "https://", "//", "/")) or "{{" in src:
         return src
-    prefix = Path(folder) if folder else Path()
-    normalized = (prefix / src).as_posix()
-    return f"/assets/images/{normalized}"
+    # Same normalization as joining pathlib paths (drop empty and "."
+    # segments, keep ".."), without allocating Path objects per image.
+    joined = f"{folder}/{src}" if folder else src
+    normalized = "/".join(part for part in joined.split("/") if part not in ("", "."))
+    return f"/assets/images/{normalized or '.'}"
+
+
+@lru_cache(maxsize=64)
+def _lexer_for(info: str):
+    """Look up a Pygments lexer by language name, memoized.
+
+    Unknown names are cached as None so they are not looked up again.
+
+    Args:
+        info: Language identifier from the code fence.
+
+    Returns:
+        Lexer instance, or None if Pygments or the language is unavailable.
+    """
+    if pygments is None:  # pragma: no cover
+        return None
+    from pygments.lexers import get_lexer_by_name
+
+    try:
+        return get_lexer_by_name(info, stripall=True)
+    except Exception:
+        return None
+
+
+@lru_cache(maxsize=1)
+def _html_formatter():
+    """Return the shared Pygments HTML formatter for code blocks."""
+    from pygments.formatters import HtmlFormatter
+
+    return HtmlFormatter(nowrap=False, cssclass="highlight")
 
 
 class _HighlightRenderer(mistune.HTMLRenderer):
@@ -71,6 +121,14 @@ class _HighlightRenderer(mistune.HTMLRenderer):
             folder: Folder path for image rewriting.
         """
         super().__init__(escape=False)
+        self.reset(folder)
+
+    def reset(self, folder: str) -> None:
+        """Prepare the renderer for a new page.
+
+        Args:
+            folder: Folder path for image rewriting.
+        """
         self.folder = folder
         self.headings: list = []
         self._heading_id_counts: dict[str, int] = {}
@@ -126,15 +184,10 @@ class _HighlightRenderer(mistune.HTMLRenderer):
         Returns:
             HTML string with highlighted code.
         """
-        if info:
+        lexer = _lexer_for(info) if info else None
+        if lexer is not None:
             try:
-                from pygments import highlight
-                from pygments.formatters import HtmlFormatter
-                from pygments.lexers import get_lexer_by_name
-
-                lexer = get_lexer_by_name(info, stripall=True)
-                formatter = HtmlFormatter(nowrap=False, cssclass="highlight")
-                return highlight(code, lexer, formatter)
+                return pygments.highlight(code, lexer, _html_formatter())
             except Exception:
                 pass
         escaped = code.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;")
@@ -147,8 +200,30 @@ class MarkdownRenderer:
 
     This renderer handles Markdown files, converting them to HTML
     with syntax highlighting and heading extraction for TOC.
+
+    The mistune parser and its plugins are built once per thread and
+    reused for every page; only the renderer's per-page state is reset.
     """
 
+    def __init__(self):
+        """Initialize the renderer."""
+        self._local = threading.local()
+
+    def _parser(self) -> tuple[_HighlightRenderer, mistune.Markdown]:
+        """Return this thread's renderer and Markdown parser.
+
+        Returns:
+            Tuple of (_HighlightRenderer, mistune Markdown instance).
+        """
+        local = self._local
+        if not hasattr(local, "markdown"):
+            local.renderer = _HighlightRenderer("")
+            local.markdown = mistune.create_markdown(
+                renderer=local.renderer,
+                plugins=["strikethrough", "footnotes", "table", "url"],
+            )
+        return local.renderer, local.markdown
+
     @property
     def source_type(self) -> str:
         """Return the source type identifier."""
@@ -169,18 +244,16 @@ class MarkdownRenderer:
         """Render Markdown content to HTML.
 
         Args:
-            content: Markdown source content.
+            content: Markdown source content, with hashtags already
+                stripped by the page builder.
             folder: Folder containing the page.
 
         Returns:
             Tuple of (rendered HTML, list of Heading objects).
         """
-        cleaned = strip_hashtags(content)
-        renderer = _HighlightRenderer(folder)
-        markdown = mistune.create_markdown(
-            renderer=renderer, plugins=["strikethrough", "footnotes", "table", "url"]
-        )
-        html = markdown(cleaned)
+        renderer, markdown = self._parser()
+        renderer.reset(folder)
+        html = markdown(content)
         return html, renderer.headings
 
 
@@ -301,3 +374,20 @@ class RendererRegistry:
 
 # Default renderer registry instance
 default_renderer_registry = RendererRegistry()
+
+_markdown_renderer = MarkdownRenderer()
+
+
+def render_markdown(content: str, folder: str) -> tuple[str, list]:
+    """Render Markdown with a module-level renderer.
+
+    A plain function so it can be shipped to worker processes.
+
+    Args:
+        content: Markdown source content.
+        folder: Folder containing the page.
+
+    Returns:
+        Tuple of (rendered HTML, list of Heading objects).
+    """
+    return _markdown_renderer.render(content, folder)
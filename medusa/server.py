@@ -26,6 +26,7 @@ import websockets
 from watchdog.events import FileSystemEventHandler
 from watchdog.observers import Observer
 
+from .asset_processors import clear_executable_cache
 from .build import build_site, load_config
 
 
@@ -332,4 +333,7 @@ class _ChangeHandler(FileSystemEventHandler):
                 pass
         if "node_modules" in path.parts:
             return
+        if path.name == "package.json":
+            # Node tooling may have been added or removed
+            clear_executable_cache()
         self.server.rebuild(self.include_drafts)
@@ -8,6 +8,8 @@ Key functions:
 - titleize: Convert filenames to human-readable titles.
 - extract_tags: Extract hashtags from text.
 - build_tags_index: Build index of pages by tags.
+- load_yaml: Parse YAML safely with the fastest available loader.
+- load_yaml_mapping: Parse a YAML mapping, returning None if it is invalid.
 """
 
 from __future__ import annotations
@@ -15,9 +17,11 @@ from __future__ import annotations
 import re
 import shutil
 import textwrap
-from collections.abc import Iterable
+from collections.abc import Iterable, Iterator
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
+from typing import IO, Any
 
 HASHTAG_RE = re.compile(r"#([a-zA-Z][a-zA-Z0-9]{2,}(?:/[a-zA-Z0-9]+)*)")
 _URL_ATTR_RE = re.compile(
@@ -34,6 +38,75 @@ _URL_SKIP_PREFIXES = (
 )
 
 
+@lru_cache(maxsize=1)
+def _yaml_loader() -> type:
+    """Return libyaml's CSafeLoader, or the pure-Python SafeLoader without it."""
+    try:
+        from yaml import CSafeLoader as loader
+    except ImportError:  # pragma: no cover - PyYAML built without libyaml
+        from yaml import SafeLoader as loader
+    return loader
+
+
+def load_yaml(stream: str | bytes | IO[str] | IO[bytes]) -> Any:
+    """Parse YAML with safe semantics, using libyaml's C parser when available.
+
+    Equivalent to yaml.safe_load but an order of magnitude faster when
+    PyYAML is built against libyaml. PyYAML is imported on first use so
+    importing medusa modules does not pay for it.
+
+    Args:
+        stream: YAML text, bytes or an open file.
+
+    Returns:
+        The parsed document.
+    """
+    import yaml
+
+    return yaml.load(stream, Loader=_yaml_loader())
+
+
+def load_yaml_mapping(text: str) -> dict[str, Any] | None:
+    """Parse a YAML mapping such as a frontmatter block.
+
+    Args:
+        text: YAML text.
+
+    Returns:
+        The parsed mapping ({} for an empty document), or None if the text
+        is not valid YAML or its document is not a mapping.
+    """
+    import yaml
+
+    try:
+        data = load_yaml(text)
+    except yaml.YAMLError:
+        return None
+    if data is None:
+        return {}
+    return data if isinstance(data, dict) else None
+
+
+def read_source(path: str | Path) -> str:
+    """Read a UTF-8 text file with universal newlines.
+
+    Reads the raw bytes in one call and decodes once, which is cheaper than
+    a text-mode read; newlines are then translated to match read_text().
+
+    Args:
+        path: File to read.
+
+    Returns:
+        File contents with CRLF and CR line endings normalized to LF.
+    """
+    with open(path, "rb") as handle:
+        text = handle.read().decode("utf-8")
+    if "\r" in text:
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+    return text
+
+
+@lru_cache(maxsize=512)
 def slugify(name: str) -> str:
     """Convert filename (without extension) to slug, dropping date prefix.
 
@@ -53,6 +126,7 @@ def slugify(name: str) -> str:
     return cleaned or "index"
 
 
+@lru_cache(maxsize=512)
 def titleize(filename: str) -> str:
     base = Path(filename).stem
     if "-" in base:
@@ -63,6 +137,7 @@ def titleize(filename: str) -> str:
     return " ".join(word.capitalize() for word in words if word) or "Untitled"
 
 
+@lru_cache(maxsize=512)
 def extract_date_from_name(name: str) -> datetime | None:
     parts = name.split("-")
     if len(parts) >= 3 and all(p.isdigit() for p in parts[:3]):
@@ -73,24 +148,81 @@ def extract_date_from_name(name: str) -> datetime | None:
     return None
 
 
+@lru_cache(maxsize=8)
+def _scan_hashtags(text: str) -> tuple[tuple[str, ...], str]:
+    """Collect hashtags and strip their markers in one regex pass.
+
+    Tag extraction, the description and the render source all scan the
+    same page text, so the fused result is memoized for the last few
+    inputs and later calls on the same text are cache hits.
+
+    Args:
+        text: Source text.
+
+    Returns:
+        Tuple of (unique tags in first-seen order, text without '#' markers).
+    """
+    tags: dict[str, None] = {}
+
+    def repl(match: re.Match) -> str:
+        tag = match.group(1)
+        tags[tag] = None
+        return tag
+
+    stripped = HASHTAG_RE.sub(repl, text)
+    return tuple(tags), stripped
+
+
 def extract_tags(text: str) -> list[str]:
-    tags = HASHTAG_RE.findall(text)
-    seen = []
-    for tag in tags:
-        if tag not in seen:
-            seen.append(tag)
-    return seen
+    return list(_scan_hashtags(text)[0])
 
 
 def strip_hashtags(text: str) -> str:
-    return HASHTAG_RE.sub(lambda m: m.group(1), text)
+    return _scan_hashtags(text)[1]
+
+
+def iter_paragraphs(text: str) -> Iterator[str]:
+    """Yield the stripped, non-empty blank-line-separated paragraphs of text.
+
+    Equivalent to filtering ``text.split("\\n\\n")`` but lazy, so callers
+    that only need the first few paragraphs never split the whole body.
+
+    Args:
+        text: Source text.
+
+    Yields:
+        Each non-empty paragraph, stripped.
+    """
+    start = 0
+    while True:
+        end = text.find("\n\n", start)
+        stripped = (text[start:] if end == -1 else text[start:end]).strip()
+        if stripped:
+            yield stripped
+        if end == -1:
+            return
+        start = end + 2
 
 
 def first_paragraph(text: str, limit: int = 160) -> str:
-    paragraphs = [p.strip() for p in text.split("\n\n") if p.strip()]
-    if not paragraphs:
+    para = next(iter_paragraphs(text), None)
+    if para is None:
         return ""
-    para = paragraphs[0].lstrip("# ").strip()
+    return summarize_paragraph(para, limit)
+
+
+def summarize_paragraph(para: str, limit: int = 160) -> str:
+    """Turn a paragraph into a plain-text summary.
+
+    Args:
+        para: Stripped paragraph text.
+        limit: Maximum summary length.
+
+    Returns:
+        The paragraph without heading markers, HTML tags or Jinja syntax,
+        whitespace-collapsed and truncated to limit.
+    """
+    para = para.lstrip("# ").strip()
     # Strip HTML tags and Jinja syntax
     para = re.sub(r"<[^>]+>", "", para)
     para = re.sub(r"\{[%#{].*?[%#}]\}", "", para)
@@ -0,0 +1,11 @@
+import pytest
+
+from medusa.asset_processors import clear_executable_cache
+
+
+@pytest.fixture(autouse=True)
+def _fresh_executable_cache():
+    """Keep executable lookups from leaking between tests that fake PATH."""
+    clear_executable_cache()
+    yield
+    clear_executable_cache()
@@ -81,9 +81,9 @@ def test_asset_pipeline_runs_without_tailwind(monkeypatch, tmp_path):
     tailwind_bin.write_text("#!/bin/sh\necho ok\n", encoding="utf-8")
     seen = {}
 
-    def fake_run(cmd, capture_output=None, text=None):
+    def fake_run(cmd, stdout=None, stderr=None):
         seen["bin"] = cmd[0]
-        return subprocess.CompletedProcess(cmd, 0, stdout="ok", stderr="")
+        return subprocess.CompletedProcess(cmd, 0, stdout=b"ok", stderr=b"")
 
     monkeypatch.setattr(subprocess, "run", fake_run)
     pipeline._process_tailwind()
@@ -102,11 +102,11 @@ def test_js_minify_prefers_terser(monkeypatch, tmp_path):
 
     calls = {}
 
-    def fake_run(cmd, capture_output=None, text=None):
+    def fake_run(cmd, stdout=None, stderr=None):
         calls["cmd"] = cmd
         dest_index = cmd.index("-o") + 1
         Path(cmd[dest_index]).write_text("minified", encoding="utf-8")
-        return subprocess.CompletedProcess(cmd, 0, stdout="ok", stderr="")
+        return subprocess.CompletedProcess(cmd, 0, stdout=b"ok", stderr=b"")
 
     monkeypatch.setattr(subprocess, "run", fake_run)
     pipeline._minify_js()
@@ -123,8 +123,8 @@ def test_js_minify_terser_failure(monkeypatch, tmp_path, capsys):
     terser_bin.parent.mkdir(parents=True, exist_ok=True)
     terser_bin.write_text("#!/bin/sh\necho terser\n", encoding="utf-8")
 
-    def fake_run(cmd, capture_output=None, text=None):
-        return subprocess.CompletedProcess(cmd, 1, stdout="", stderr="fail")
+    def fake_run(cmd, stdout=None, stderr=None):
+        return subprocess.CompletedProcess(cmd, 1, stdout=b"", stderr=b"fail")
 
     monkeypatch.setattr(subprocess, "run", fake_run)
     pipeline._minify_js()
@@ -141,15 +141,17 @@ def test_asset_pipeline_with_tailwind(monkeypatch, tmp_path):
     fake_bin.parent.mkdir()
     fake_bin.write_text("#!/bin/sh\necho built\n", encoding="utf-8")
 
-    def fake_run(cmd, capture_output=None, text=None):
+    def fake_run(cmd, stdout=None, stderr=None):
         # simulate Tailwind writing output
         out_path = Path(cmd[4])
         out_path.parent.mkdir(parents=True, exist_ok=True)
         out_path.write_text("body{}", encoding="utf-8")
-        cp = subprocess.CompletedProcess(cmd, 0, stdout="ok", stderr="")
+        cp = subprocess.CompletedProcess(cmd, 0, stdout=b"ok", stderr=b"")
         return cp
 
-    monkeypatch.setattr(shutil, "which", lambda _: str(fake_bin))
+    monkeypatch.setattr(
+        shutil, "which", lambda name: str(fake_bin) if name == "tailwindcss" else None
+    )
     monkeypatch.setattr(subprocess, "run", fake_run)
     pipeline.run()
 
@@ -170,6 +172,16 @@ def test_asset_pipeline_missing_assets(tmp_path):
     assert not output.exists()
 
 
+def test_asset_pipeline_default_workers(monkeypatch, tmp_path):
+    monkeypatch.setattr("os.cpu_count", lambda: 2)
+    assert AssetPipeline(tmp_path, tmp_path / "out").max_workers == 8
+    monkeypatch.setattr("os.cpu_count", lambda: None)
+    assert AssetPipeline(tmp_path, tmp_path / "out").max_workers == 4
+    monkeypatch.setattr("os.cpu_count", lambda: 64)
+    assert AssetPipeline(tmp_path, tmp_path / "out").max_workers == 32
+    assert AssetPipeline(tmp_path, tmp_path / "out", max_workers=3).max_workers == 3
+
+
 def test_tailwind_missing_input(monkeypatch, tmp_path):
     project = tmp_path / "proj"
     (project / "assets").mkdir(parents=True)
@@ -185,8 +197,8 @@ def test_tailwind_failure(monkeypatch, tmp_path, capsys):
 
     monkeypatch.setattr(shutil, "which", lambda _: "tailwindcss")
 
-    def fake_run(cmd, capture_output=None, text=None):
-        return subprocess.CompletedProcess(cmd, 1, stdout="", stderr="boom")
+    def fake_run(cmd, stdout=None, stderr=None):
+        return subprocess.CompletedProcess(cmd, 1, stdout=b"", stderr=b"boom")
 
     monkeypatch.setattr(subprocess, "run", fake_run)
     pipeline._process_tailwind()
@@ -320,6 +332,23 @@ def test_build_without_root_url(tmp_path):
     assert "plain" in plain_content
 
 
+def test_load_data_merges_in_sorted_order(tmp_path):
+    data_dir = tmp_path / "data"
+    data_dir.mkdir()
+    for i in range(12):
+        (data_dir / f"part{i:02d}.yaml").write_text(f"n: {i}", encoding="utf-8")
+    (data_dir / "site.yaml").write_text(
+        "title: Site\npart00: override", encoding="utf-8"
+    )
+
+    data = load_data(tmp_path)
+    assert data["title"] == "Site"
+    # site.yaml sorts after part*.yaml, so its keys win
+    assert data["part00"] == "override"
+    assert data["part11"] == {"n": 11}
+    assert list(data)[:2] == ["part00", "part01"]
+
+
 def test_build_helpers_handle_missing(monkeypatch, tmp_path):
     project = tmp_path / "proj"
     project.mkdir()
@@ -353,6 +382,33 @@ def test_build_helpers_handle_missing(monkeypatch, tmp_path):
         build_site(project)
 
 
+def test_build_site_without_cache(tmp_path):
+    """Test build_site(use_cache=False) drops stale cached assets."""
+    project = create_project(tmp_path)
+    stale = project / ".medusa-cache" / "js" / "stale.js"
+    stale.parent.mkdir(parents=True)
+    stale.write_text("stale", encoding="utf-8")
+
+    build_site(project)
+    assert stale.exists()
+
+    build_site(project, use_cache=False)
+    assert not stale.exists()
+
+
+def test_build_site_reprocesses_existing_assets(tmp_path):
+    """Test a non-cleaning build rewrites assets already in the output."""
+    project = create_project(tmp_path)
+    (project / "assets" / "images" / "logo.svg").write_text("<svg/>")
+    build_site(project, clean_output=False)
+    output = project / "output" / "assets" / "images" / "logo.svg"
+    output.unlink()
+    output.write_text("hand-edited")
+
+    build_site(project, clean_output=False, use_cache=False)
+    assert output.read_text() == "<svg/>"
+
+
 def test_build_site_without_clean_output(tmp_path):
     """Test build_site with clean_output=False creates output dir if missing."""
     project = create_project(tmp_path)
@@ -459,3 +515,117 @@ def test_build_site_missing_asset_error(tmp_path):
     assert exc_info.value.source_path == bad_page
     assert "Missing image asset" in exc_info.value.message
     assert "nonexistent-image" in exc_info.value.message
+
+
+def test_build_site_reports_first_failing_page(tmp_path, monkeypatch):
+    """Test build_site raises for the first failing page in order."""
+    from medusa.content import ContentProcessor
+
+    project = create_project(tmp_path)
+    first = project / "site" / "a-broken.html.jinja"
+    first.write_text("{{ img_path('first-missing') }}", encoding="utf-8")
+    second = project / "site" / "b-broken.html.jinja"
+    second.write_text("{{ img_path('second-missing') }}", encoding="utf-8")
+
+    original_load = ContentProcessor.load
+
+    def load_in_name_order(self, include_drafts=False):
+        return sorted(original_load(self, include_drafts), key=lambda p: p.path.name)
+
+    monkeypatch.setattr(ContentProcessor, "load", load_in_name_order)
+    with pytest.raises(BuildError) as exc_info:
+        build_site(project)
+
+    assert exc_info.value.source_path == first
+
+
+def test_build_site_builds_assets_alongside_pages(tmp_path, monkeypatch):
+    """Test assets build on a worker thread and their errors propagate."""
+    import threading
+
+    project = create_project(tmp_path)
+    threads = []
+
+    def fake_run(self):
+        threads.append(threading.current_thread())
+        raise RuntimeError("tailwind exploded")
+
+    monkeypatch.setattr(AssetPipeline, "run", fake_run)
+    with pytest.raises(RuntimeError, match="tailwind exploded"):
+        build_site(project)
+
+    assert threads and threads[0] is not threading.current_thread()
+    assert (project / "output" / "index.html").exists()
+
+
+def test_feeds_escape_xml_special_characters(tmp_path):
+    """Test sitemap and RSS output stay well-formed with special characters."""
+    from datetime import datetime
+    from types import SimpleNamespace
+    from xml.etree import ElementTree
+
+    from medusa.build import _write_rss, _write_sitemap
+
+    page = SimpleNamespace(
+        url="/q/?a=1&b=2/",
+        date=datetime(2024, 1, 2),
+        title="Fish & <Chips>",
+        description="",
+    )
+    data = {"url": "https://example.com", "title": "Tom & Jerry"}
+    _write_sitemap(tmp_path, data, [page])
+    _write_rss(tmp_path, data, [page])
+
+    sitemap = ElementTree.parse(tmp_path / "sitemap.xml").getroot()
+    ns = "{http://www.sitemaps.org/schemas/sitemap/0.9}"
+    assert sitemap.find(f"{ns}url/{ns}loc").text == "https://example.com/q/?a=1&b=2/"
+    channel = ElementTree.parse(tmp_path / "rss.xml").getroot().find("channel")
+    assert channel.find("title").text == "Tom & Jerry"
+    assert channel.find("item/title").text == "Fish & <Chips>"
+    assert channel.find("item/description").text == "Fish & <Chips>"
+
+
+def test_make_page_dirs_creates_each_directory_once(tmp_path, monkeypatch):
+    from types import SimpleNamespace
+
+    from medusa.build import _make_page_dirs
+
+    pages = [
+        SimpleNamespace(url=url)
+        for url in ("/", "/posts/", "/posts/hello/", "/posts/hello/", "/a/b/c/")
+    ]
+    created = []
+    original_mkdir = Path.mkdir
+
+    def recording_mkdir(self, *args, **kwargs):
+        created.append(self.relative_to(tmp_path).as_posix())
+        return original_mkdir(self, *args, **kwargs)
+
+    monkeypatch.setattr(Path, "mkdir", recording_mkdir)
+    _make_page_dirs(tmp_path, pages)
+    assert created[:2] == [".", "posts"]
+    assert created.count("posts/hello") == 1
+    assert set(created) == {".", "posts", "posts/hello", "a/b/c", "a/b", "a"}
+
+
+def test_write_bytes_handles_short_writes(tmp_path, monkeypatch):
+    import os
+
+    from medusa.build import _write_bytes
+
+    target = tmp_path / "index.html"
+    target.write_text("old, longer content", encoding="utf-8")
+    real_write = os.write
+    monkeypatch.setattr(os, "write", lambda fd, data: real_write(fd, data[:3]))
+    _write_bytes(target, "héllo".encode())
+    assert target.read_text(encoding="utf-8") == "héllo"
+
+
+def test_rss_last_build_date_bypasses_date_cache(tmp_path):
+    """Test the per-build timestamp is not added to the pubDate memo."""
+    from medusa.build import _format_rfc822, _write_rss
+
+    _format_rfc822.cache_clear()
+    _write_rss(tmp_path, {"url": "https://example.com"}, [])
+    assert "<lastBuildDate>" in (tmp_path / "rss.xml").read_text()
+    assert _format_rfc822.cache_info().currsize == 0
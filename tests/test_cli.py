@@ -28,6 +28,18 @@ def test_cli_new_scaffolds_project(tmp_path):
     assert result.exit_code != 0
 
 
+def test_cli_new_skips_install_and_git(monkeypatch, tmp_path):
+    def fail(root):
+        raise AssertionError("should not run")
+
+    monkeypatch.setattr("medusa.cli._try_npm_install", fail)
+    monkeypatch.setattr("medusa.cli._try_git_init", fail)
+    target = tmp_path / "mysite"
+    result = CliRunner().invoke(cli, ["new", str(target), "--no-install", "--no-git"])
+    assert result.exit_code == 0
+    assert (target / "package.json").exists()
+
+
 def test_cli_build_and_serve(monkeypatch, tmp_path):
     runner = CliRunner()
     project = tmp_path / "mysite"
@@ -40,9 +52,11 @@ def test_cli_build_and_serve(monkeypatch, tmp_path):
         root_url=None,
         clean_output=True,
         output_dir_override=None,
+        use_cache=True,
     ):
+        called["use_cache"] = use_cache
         out = root / "output"
-        out.mkdir()
+        out.mkdir(exist_ok=True)
         return BuildResult(pages=[], output_dir=out, data={})
 
     called = {}
@@ -62,6 +76,11 @@ def test_cli_build_and_serve(monkeypatch, tmp_path):
 
     result = runner.invoke(cli, ["build"], catch_exceptions=False)
     assert result.exit_code == 0
+    assert called["use_cache"] is True
+
+    result = runner.invoke(cli, ["build", "--no-cache"], catch_exceptions=False)
+    assert result.exit_code == 0
+    assert called["use_cache"] is False
 
     result = runner.invoke(
         cli,
@@ -89,6 +108,7 @@ def test_cli_build_error_display(monkeypatch, tmp_path):
         root_url=None,
         clean_output=True,
         output_dir_override=None,
+        use_cache=True,
     ):
         raise BuildError(
             broken_file,
@@ -196,6 +216,8 @@ def test_md_helper_functions(tmp_path):
     assert _extract_slug("2024-01-15-my-post.md") == "my-post"
     assert _extract_slug("2024-12-18-hello-world.md") == "hello-world"
     assert _extract_slug("simple.md") == "simple"
+    assert _extract_slug("2024-01-notes.md") == "2024-01-notes"
+    assert _extract_slug("2024-1-5-Mixed-Case.md") == "mixed-case"
 
     # Test _get_existing_slugs
     posts_dir = site_dir / "posts"
@@ -58,6 +58,24 @@ def test_page_collection_filters_and_latest():
     assert pages.with_tag("python")[0].title == "C"
 
 
+def test_page_collection_chained_filters_share_pages():
+    pages = PageCollection(
+        [
+            FakePage("A", group="posts", tags=["x"], filename="a.md"),
+            FakePage("B", group="posts", tags=["x"], draft=True, filename="b.md"),
+            FakePage("C", group="docs", tags=["x"], filename="c.md"),
+            FakePage("D", group="posts", filename="d.md"),
+        ]
+    )
+    view = pages.published().group("posts").with_tag("x")
+    assert view._pages is pages._pages
+    assert [p.title for p in view] == ["A"]
+    assert len(view) == 1
+    assert view[0].title == "A"
+    assert [p.title for p in view] == ["A"]
+    assert [p.title for p in view.latest(5)] == ["A"]
+
+
 def test_sorting_by_date_number_filename():
     """Test that sorting uses date, then number, then filename."""
     # Same date, different numbers
@@ -141,3 +159,34 @@ def test_tag_collection_access():
     assert list(tags.values())[0][0] is p1
     assert list(tags.items())[0][0] == "python"
     assert tags.get("missing") is None
+
+
+def test_page_collection_latest_matches_sorted_prefix():
+    pages = PageCollection(
+        [
+            FakePage(f"P{i}", date=datetime(2024, 1, 1 + i % 3), filename=name)
+            for i, name in enumerate(
+                ["b.md", "02-x.md", "a.md", "01-y.md", "c.md", "03-z.md", "a.md"]
+            )
+        ]
+    )
+    expected = list(pages.sorted())[:4]
+    fresh = PageCollection(list(pages))
+    assert list(fresh.latest(4)) == expected
+    assert list(pages.latest(4)) == expected
+
+
+def test_page_collection_caches_both_sort_orders():
+    pages = PageCollection(
+        [
+            FakePage("Plain", date=datetime(2024, 1, 1), filename="plain.md"),
+            FakePage("One", date=datetime(2024, 1, 1), filename="01-one.md"),
+            FakePage("Newer", date=datetime(2024, 1, 2), filename="newer.md"),
+        ]
+    )
+    ascending = pages.sorted(reverse=False)
+    assert [p.title for p in ascending] == ["Plain", "One", "Newer"]
+    assert pages.sorted(reverse=False) is ascending
+    descending = pages.sorted()
+    assert [p.title for p in descending] == ["Newer", "Plain", "One"]
+    assert pages.sorted() is descending
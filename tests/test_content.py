@@ -1,6 +1,8 @@
 from datetime import datetime
 from pathlib import Path
 
+import pytest
+
 from medusa.content import (
     ContentProcessor,
     _extract_excerpt,
@@ -89,6 +91,34 @@ def test_include_drafts_and_url_rules(tmp_path):
     )
 
 
+@pytest.mark.parametrize(
+    "src,folder",
+    [
+        ("photo.png", ""),
+        ("photo.png", "gallery"),
+        ("./photo.png", "gallery/2024"),
+        ("../shared//photo.png", "gallery"),
+        ("nested/./a.png", ""),
+        (".", ""),
+    ],
+)
+def test_rewrite_image_path_matches_pathlib_join(src, folder):
+    prefix = Path(folder) if folder else Path()
+    expected = f"/assets/images/{(prefix / src).as_posix()}"
+    assert _rewrite_image_path(src, folder) == expected
+
+
+def test_pages_in_a_folder_share_interned_strings(tmp_path):
+    site = tmp_path / "site"
+    (site / "posts").mkdir(parents=True)
+    for name in ("a.md", "b.md"):
+        (site / "posts" / name).write_text("Hello", encoding="utf-8")
+    first, second = ContentProcessor(site).load()
+    assert first.folder is second.folder
+    assert first.group is second.group
+    assert first.layout is second.layout
+
+
 def test_rewrite_inline_images(tmp_path):
     processor = ContentProcessor(tmp_path)
     html = '<p><img src="photo.png"></p>'
@@ -96,6 +126,28 @@ def test_rewrite_inline_images(tmp_path):
     assert "/assets/images/gallery/photo.png" in rewritten
 
 
+def test_rewrite_inline_images_only_touches_src(tmp_path):
+    processor = ContentProcessor(tmp_path)
+    html = '<img alt="photo.png" src="photo.png" title="photo.png">'
+    rewritten = processor._rewrite_inline_images(html, "")
+    assert rewritten == (
+        '<img alt="photo.png" src="/assets/images/photo.png" title="photo.png">'
+    )
+
+
+def test_markdown_raw_img_tags_are_rewritten(tmp_path):
+    site = tmp_path / "site"
+    (site / "gallery").mkdir(parents=True)
+    (site / "gallery" / "index.md").write_text(
+        '![md](a.png)\n\n<img src="b.png">\n\n<img src="https://x.io/c.png">\n',
+        encoding="utf-8",
+    )
+    content = ContentProcessor(site).load()[0].content
+    assert 'src="/assets/images/gallery/a.png"' in content
+    assert 'src="/assets/images/gallery/b.png"' in content
+    assert 'src="https://x.io/c.png"' in content
+
+
 def test_rewrite_image_path_skips_jinja_expressions():
     """Verify that Jinja template expressions are not rewritten."""
     # Jinja expressions should be left unchanged
@@ -624,6 +676,24 @@ def test_code_block_with_invalid_language(tmp_path):
     assert "code here" in result
 
 
+def test_code_block_reuses_lexer_and_survives_highlight_errors(monkeypatch):
+    """Test lexers are looked up once and highlight failures fall back."""
+    import medusa.renderers as renderers
+
+    renderers._lexer_for.cache_clear()
+    renderer = renderers._HighlightRenderer("")
+    renderer.block_code("x = 1", info="python")
+    renderer.block_code("y = 2", info="python")
+    assert renderers._lexer_for.cache_info().hits == 1
+
+    def broken_highlight(code, lexer, formatter):
+        raise ValueError("boom")
+
+    monkeypatch.setattr(renderers.pygments, "highlight", broken_highlight)
+    result = renderer.block_code("a < b", info="python")
+    assert result == '<pre><code class="language-python">a &lt; b</code></pre>\n'
+
+
 def test_code_block_without_language_info():
     """Test code block rendering without language specification."""
     from medusa.content import _HighlightRenderer
@@ -638,3 +708,12 @@ def test_code_block_without_language_info():
     result = renderer.block_code("plain code", info="")
     assert "<pre><code>" in result
     assert "plain code" in result
+
+
+def test_page_instances_use_slots(tmp_path):
+    site = tmp_path / "site"
+    site.mkdir()
+    (site / "index.md").write_text("# Home\n\n## Part", encoding="utf-8")
+    page = ContentProcessor(site).load()[0]
+    assert not hasattr(page, "__dict__")
+    assert not hasattr(page.toc[0], "__dict__")
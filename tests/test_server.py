@@ -560,3 +560,17 @@ def test_change_handler_with_none_staging_dir(tmp_path):
     # Should still work and call rebuild
     handler.on_any_event(DummyEvent(str(tmp_path / "site" / "index.md")))
     assert called.get("hit") is True
+
+
+def test_change_handler_clears_executable_cache_on_package_json(tmp_path):
+    from medusa import asset_processors
+
+    server = DevServer(tmp_path)
+    server.rebuild = lambda include_drafts: None
+    handler = _ChangeHandler(server, include_drafts=False)
+    asset_processors._EXECUTABLE_CACHE[("terser", str(tmp_path))] = "/bin/terser"
+
+    handler.on_any_event(DummyEvent(str(tmp_path / "site" / "index.md")))
+    assert asset_processors._EXECUTABLE_CACHE
+    handler.on_any_event(DummyEvent(str(tmp_path / "package.json")))
+    assert not asset_processors._EXECUTABLE_CACHE
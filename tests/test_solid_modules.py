@@ -15,6 +15,7 @@ from medusa.asset_processors import (
     JSProcessor,
     StaticAssetProcessor,
     TailwindCSSProcessor,
+    clear_executable_cache,
     create_default_registry,
 )
 from medusa.asset_resolver import AssetNotFoundError, DefaultAssetPathResolver
@@ -57,6 +58,19 @@ def test_title_extractor_fallback():
     assert "My Test File" in result["title"]
 
 
+def test_title_extractor_skips_non_h1_lines():
+    """Test TitleExtractor finds the first indented H1 past other headings."""
+    extractor = TitleExtractor()
+    content = "## Sub\r\n#\n#tag line\n   #  Real Title  \r\n# Later\n"
+    assert extractor.extract(content, Path("x.md"))["title"] == "Real Title"
+
+
+def test_description_extractor_empty_content():
+    """Test DescriptionExtractor returns empty values for blank content."""
+    result = DescriptionExtractor().extract("\n\n  \n", Path("empty.md"))
+    assert result == {"description": "", "excerpt": ""}
+
+
 def test_tag_extractor():
     """Test TagExtractor extracts hashtags."""
     extractor = TagExtractor()
@@ -105,6 +119,14 @@ def test_frontmatter_extractor():
     assert result["body"] == "Content"
 
 
+def test_frontmatter_extractor_blank_block():
+    """Test a whitespace-only frontmatter block is stripped without parsing."""
+    extractor = FrontmatterExtractor()
+    result = extractor.extract("---\n  \n---\nContent", Path("test.md"))
+    assert result["frontmatter"] == {}
+    assert result["body"] == "Content"
+
+
 def test_composite_extractor():
     """Test CompositeMetadataExtractor combines extractors."""
     extractor = CompositeMetadataExtractor([TitleExtractor()])
@@ -112,6 +134,17 @@ def test_composite_extractor():
     assert result["title"] == "Title"
 
 
+def test_composite_extractor_passes_body_after_frontmatter():
+    """Test extractors after the frontmatter one only see the body."""
+    extractor = CompositeMetadataExtractor(
+        [FrontmatterExtractor(), TagExtractor(), DescriptionExtractor()]
+    )
+    content = '---\ncolor: "#abcdef"\n---\n\nHello #world'
+    result = extractor.extract(content, Path("test.md"))
+    assert result["tags"] == ["world"]
+    assert result["description"] == "Hello world"
+
+
 def test_composite_extractor_add():
     """Test adding extractors to composite."""
     extractor = CompositeMetadataExtractor([])
@@ -134,6 +167,20 @@ def test_markdown_renderer():
     assert "Hello" in html
 
 
+def test_markdown_renderer_reuses_parser_with_fresh_state():
+    """Test MarkdownRenderer reuses its parser but resets per-page state."""
+    renderer = MarkdownRenderer()
+    html, headings = renderer.render("# Intro\n\n![a](a.png)", "posts")
+    parser = renderer._parser()
+    assert 'src="/assets/images/posts/a.png"' in html
+    assert [h.id for h in headings] == ["intro"]
+
+    html, headings = renderer.render("# Intro\n\n![b](b.png)", "")
+    assert renderer._parser()[1] is parser[1]
+    assert 'src="/assets/images/b.png"' in html
+    assert [h.id for h in headings] == ["intro"]
+
+
 def test_html_renderer():
     """Test HTMLRenderer passes through HTML."""
     renderer = HTMLRenderer()
@@ -199,6 +246,19 @@ def test_image_processor(tmp_path):
     assert dest.exists()
 
 
+def test_image_processor_keeps_format(tmp_path, monkeypatch):
+    """Test ImageProcessor re-encodes in the source format."""
+    from PIL import Image
+
+    monkeypatch.setattr("shutil.which", lambda name: None)
+    source = tmp_path / "photo.jpg"
+    Image.new("RGB", (10, 10), color="green").save(source, format="JPEG")
+    dest = tmp_path / "out" / "photo.jpg"
+    ImageProcessor().process(source, dest)
+    with Image.open(dest) as img:
+        assert img.format == "JPEG"
+
+
 def test_image_processor_fallback(tmp_path, monkeypatch):
     """Test ImageProcessor falls back when PIL fails."""
     monkeypatch.setattr("medusa.asset_processors.Image", None)
@@ -212,6 +272,106 @@ def test_image_processor_fallback(tmp_path, monkeypatch):
     assert dest.exists()
 
 
+def test_image_processor_cache_hit(tmp_path, monkeypatch):
+    """Test ImageProcessor reuses cached output for unchanged images."""
+    from PIL import Image
+
+    processor = ImageProcessor(tmp_path)
+    source = tmp_path / "source.png"
+    Image.new("RGB", (10, 10), color="blue").save(source)
+    dest = tmp_path / "out" / "source.png"
+    processor.process(source, dest)
+    assert list((tmp_path / ".medusa-cache" / "img").iterdir())
+
+    def fail_open(*args, **kwargs):
+        raise AssertionError("cache miss")
+
+    monkeypatch.setattr(Image, "open", fail_open)
+    other = tmp_path / "out2" / "source.png"
+    ImageProcessor(tmp_path).process(source, other)
+    assert other.read_bytes() == dest.read_bytes()
+
+
+def test_image_processor_external_optimizers(tmp_path, monkeypatch):
+    """Test ImageProcessor prefers oxipng and jpegoptim when installed."""
+    import subprocess
+
+    calls = []
+
+    def mock_run(cmd, capture_output=None):
+        calls.append(Path(cmd[0]).name)
+        if cmd[0].endswith("oxipng"):
+            Path(cmd[cmd.index("--out") + 1]).write_bytes(b"png")
+            return subprocess.CompletedProcess(cmd, 0, stdout=b"", stderr=b"")
+        return subprocess.CompletedProcess(cmd, 0, stdout=b"jpeg", stderr=b"")
+
+    monkeypatch.setattr("shutil.which", lambda name: f"/usr/bin/{name}")
+    monkeypatch.setattr("subprocess.run", mock_run)
+    processor = ImageProcessor()
+
+    png = tmp_path / "a.png"
+    png.write_bytes(b"raw")
+    processor.process(png, tmp_path / "out" / "a.png")
+    assert (tmp_path / "out" / "a.png").read_bytes() == b"png"
+
+    jpg = tmp_path / "b.jpg"
+    jpg.write_bytes(b"raw")
+    processor.process(jpg, tmp_path / "out" / "b.jpg")
+    assert (tmp_path / "out" / "b.jpg").read_bytes() == b"jpeg"
+    assert calls == ["oxipng", "jpegoptim"]
+
+
+def test_image_processor_uses_jpegtran(tmp_path, monkeypatch):
+    """Test ImageProcessor falls back to jpegtran without jpegoptim."""
+    import subprocess
+
+    calls = []
+
+    def mock_run(cmd, capture_output=None):
+        calls.append(cmd[1:-3])
+        Path(cmd[cmd.index("-outfile") + 1]).write_bytes(b"progressive")
+        return subprocess.CompletedProcess(cmd, 0, stdout=b"", stderr=b"")
+
+    monkeypatch.setattr(
+        "shutil.which", lambda name: "/usr/bin/jpegtran" if name == "jpegtran" else None
+    )
+    monkeypatch.setattr("subprocess.run", mock_run)
+    source = tmp_path / "photo.jpeg"
+    source.write_bytes(b"raw")
+    dest = tmp_path / "out" / "photo.jpeg"
+    ImageProcessor().process(source, dest)
+    assert dest.read_bytes() == b"progressive"
+    assert calls == [["-optimize", "-progressive", "-copy", "none"]]
+
+
+def test_image_processor_external_optimizer_failure(tmp_path, monkeypatch):
+    """Test ImageProcessor falls back when the external optimizer fails."""
+    import subprocess
+
+    def mock_run(cmd, capture_output=None):
+        return subprocess.CompletedProcess(cmd, 1, stdout=b"", stderr=b"bad")
+
+    monkeypatch.setattr("medusa.asset_processors.Image", None)
+    monkeypatch.setattr("shutil.which", lambda name: f"/usr/bin/{name}")
+    monkeypatch.setattr("subprocess.run", mock_run)
+    processor = ImageProcessor()
+    for name in ("a.png", "b.jpg"):
+        source = tmp_path / name
+        source.write_bytes(b"raw")
+        dest = tmp_path / "out" / name
+        processor.process(source, dest)
+        assert dest.read_bytes() == b"raw"
+
+    clear_executable_cache()
+    monkeypatch.setattr(
+        "shutil.which", lambda name: "/usr/bin/jpegtran" if name == "jpegtran" else None
+    )
+    source = tmp_path / "c.jpg"
+    source.write_bytes(b"raw")
+    ImageProcessor().process(source, tmp_path / "out" / "c.jpg")
+    assert (tmp_path / "out" / "c.jpg").read_bytes() == b"raw"
+
+
 def test_css_processor(tmp_path):
     """Test CSSProcessor copies CSS files."""
     processor = CSSProcessor()
@@ -303,6 +463,32 @@ def test_asset_processor_registry():
     assert registry.get_processor(Path("test.css")) is not None
 
 
+def test_asset_processor_registry_suffix_dispatch(tmp_path):
+    """Test AssetProcessorRegistry only consults processors for the suffix."""
+
+    class CountingImageProcessor(ImageProcessor):
+        calls = 0
+
+        def can_process(self, path):
+            CountingImageProcessor.calls += 1
+            return super().can_process(path)
+
+    registry = AssetProcessorRegistry()
+    registry.register(CountingImageProcessor())
+    registry.register(StaticAssetProcessor())
+
+    assert isinstance(registry.get_processor(Path("font.woff2")), StaticAssetProcessor)
+    assert CountingImageProcessor.calls == 0
+    assert isinstance(registry.get_processor(Path("LOGO.PNG")), ImageProcessor)
+    assert CountingImageProcessor.calls == 1
+    assert isinstance(registry.get_processor(Path("logo.png")), ImageProcessor)
+    assert set(registry._by_suffix) == {".woff2", ".PNG", ".png"}
+
+    # Registering invalidates the dispatch table
+    registry.register(CSSProcessor())
+    assert isinstance(registry.get_processor(Path("site.css")), CSSProcessor)
+
+
 def test_create_default_registry(tmp_path):
     """Test create_default_registry creates configured registry."""
     registry = create_default_registry(tmp_path, tmp_path / "out")
@@ -359,6 +545,65 @@ def test_asset_resolver_font_auto_detect(tmp_path):
     assert resolver.font_path("inter") == "/assets/fonts/inter.woff2"
 
 
+def test_asset_resolver_caches_listing(tmp_path):
+    """Test DefaultAssetPathResolver lists asset directories once."""
+    site_dir = tmp_path / "site"
+    site_dir.mkdir()
+    images = tmp_path / "assets" / "images"
+    (images / "icons").mkdir(parents=True)
+    (images / "icons" / "star.svg").write_text("svg")
+
+    resolver = DefaultAssetPathResolver(site_dir)
+    assert resolver.img_path("icons/star") == "/assets/images/icons/star.svg"
+
+    (images / "logo.png").write_text("img")
+    # Not in the listing snapshot; found through the stat fallback
+    assert resolver.img_path("logo") == "/assets/images/logo.png"
+    assert resolver._listing("images") == frozenset({"icons/star.svg"})
+
+    resolver.invalidate()
+    assert "logo.png" in resolver._listing("images")
+
+
+def test_asset_resolver_normalizes_names(tmp_path):
+    """Test equivalent spellings of a path resolve like the baseline did."""
+    site_dir = tmp_path / "site"
+    site_dir.mkdir()
+    images = tmp_path / "assets" / "images"
+    (images / "sub").mkdir(parents=True)
+    (images / "x.png").write_text("img")
+    (images / "sub" / "y.png").write_text("img")
+
+    resolver = DefaultAssetPathResolver(site_dir)
+    assert resolver.img_path("./x.png") == "/assets/images/./x.png"
+    assert resolver.img_path("sub//y") == "/assets/images/sub//y.png"
+    with pytest.raises(AssetNotFoundError):
+        resolver.img_path("nope")
+
+
+def test_asset_resolver_memoizes_results(tmp_path):
+    """Test DefaultAssetPathResolver memoizes hits and misses."""
+    site_dir = tmp_path / "site"
+    site_dir.mkdir()
+    (tmp_path / "assets" / "js").mkdir(parents=True)
+    (tmp_path / "assets" / "js" / "app.js").write_text("js")
+
+    resolver = DefaultAssetPathResolver(site_dir)
+    assert resolver.js_path("app") == "/assets/js/app.js"
+    errors = []
+    for _ in range(2):
+        with pytest.raises(AssetNotFoundError) as excinfo:
+            resolver.js_path("missing")
+        errors.append(excinfo.value)
+    # Each miss raises its own error; a shared instance would have its
+    # traceback overwritten by concurrent page renders
+    assert errors[0] is not errors[1]
+    assert errors[1].searched_paths == [tmp_path / "assets" / "js" / "missing.js"]
+
+    resolver.set_url_generator(lambda path: f"https://cdn.example.com{path}")
+    assert resolver.js_path("app") == "https://cdn.example.com/assets/js/app.js"
+
+
 def test_asset_resolver_missing():
     """Test DefaultAssetPathResolver raises for missing assets."""
     resolver = DefaultAssetPathResolver(Path("/nonexistent"))
@@ -412,6 +657,48 @@ def test_file_content_loader(tmp_path):
     assert len(files_with_drafts) == 2
 
 
+def test_file_content_loader_prunes_internal_dirs(tmp_path):
+    """Test FileContentLoader skips whole underscore directory trees."""
+    site_dir = tmp_path / "site"
+    (site_dir / "_partials" / "nested").mkdir(parents=True)
+    (site_dir / "_partials" / "nested" / "skip.md").write_text("# Skip")
+    (site_dir / "posts" / "_includes").mkdir(parents=True)
+    (site_dir / "posts" / "_includes" / "skip.md").write_text("# Skip")
+    (site_dir / "posts" / "hello.md").write_text("# Hello")
+    (site_dir / "posts" / "notes.txt").write_text("ignored")
+
+    files = FileContentLoader(site_dir).iter_files(include_drafts=True)
+    assert files == [site_dir / "posts" / "hello.md"]
+
+
+@pytest.mark.parametrize(
+    "name",
+    [
+        "a.md",
+        "A.MD",
+        "a.html",
+        "a.HTML",
+        "a.html.jinja",
+        "a.jinja",
+        "a.JINJA",
+        ".md",
+        ".hidden.md",
+        "a.txt",
+        "README",
+        "a.md.bak",
+    ],
+)
+def test_is_source_name_matches_path_helpers(name):
+    """Test name-based classification agrees with the Path helpers."""
+    from medusa.content import _is_source_name
+    from medusa.utils import is_html, is_markdown, is_template
+
+    path = Path(name)
+    assert _is_source_name(name) == (
+        is_markdown(path) or is_template(path) or is_html(path)
+    )
+
+
 def test_layout_resolver(tmp_path):
     """Test LayoutResolver resolves layouts."""
     site_dir = tmp_path / "site"
@@ -424,12 +711,42 @@ def test_layout_resolver(tmp_path):
     assert resolver.resolve(Path("test.md"), "posts") == "posts"
 
 
+def test_layout_resolver_nested_layouts(tmp_path):
+    """Test LayoutResolver finds folder-specific layouts from its snapshot."""
+    layouts = tmp_path / "site" / "_layouts" / "docs"
+    layouts.mkdir(parents=True)
+    (layouts / "intro.html.jinja").write_text("intro")
+
+    resolver = LayoutResolver(tmp_path / "site")
+    assert resolver.resolve(Path("intro.md"), "docs") == "docs/intro"
+    assert resolver.resolve(Path("other.md"), "docs") == "docs"
+    assert resolver.resolve(Path("other.md"), "blog") == "default"
+
+
+def test_layout_resolver_refresh(tmp_path):
+    """Test LayoutResolver only sees new layouts after a refresh."""
+    layouts = tmp_path / "site" / "_layouts"
+    layouts.mkdir(parents=True)
+
+    resolver = LayoutResolver(tmp_path / "site")
+    assert resolver.resolve(Path("a.md"), "posts") == "default"
+    (layouts / "posts.jinja").write_text("posts")
+    assert resolver.resolve(Path("a.md"), "posts") == "default"
+    resolver.refresh()
+    assert resolver.resolve(Path("a.md"), "posts") == "posts"
+
+
 def test_url_deriver():
     """Test UrlDeriver generates correct URLs."""
     deriver = UrlDeriver()
     assert deriver.derive(Path("index.md"), "index") == "/"
     assert deriver.derive(Path("about.md"), "about") == "/about/"
     assert deriver.derive(Path("posts/hello.md"), "hello") == "/posts/hello/"
+    assert deriver.derive(Path("docs/guide/index.md"), "index") == "/docs/guide/"
+    assert deriver.derive(Path("docs/guide/setup.md"), "setup") == "/docs/guide/setup/"
+    assert deriver.derive(Path("docs/index.html.jinja"), "index-html") == (
+        "/docs/index-html/"
+    )
 
 
 def test_default_page_builder(tmp_path):
@@ -461,6 +778,178 @@ def test_content_processor_with_custom_components(tmp_path):
     assert len(pages) == 1
 
 
+def test_page_builder_build_all_renders_in_process_pool(tmp_path, monkeypatch):
+    """Test build_all matches build() when markdown goes to worker processes."""
+    import medusa.content as content_module
+
+    monkeypatch.setattr(content_module, "PARALLEL_RENDER_THRESHOLD", 2)
+    monkeypatch.setattr(content_module.os, "cpu_count", lambda: 2)
+    site_dir = tmp_path / "site"
+    (site_dir / "posts").mkdir(parents=True)
+    (site_dir / "posts" / "a.md").write_text("# A #python\n\n![x](x.png)")
+    (site_dir / "b.md").write_text("# B\n\n## Sub")
+    (site_dir / "c.html").write_text('<img src="c.png">')
+    (site_dir / "d.xyz").write_text("raw")
+    items = [
+        (site_dir / "posts" / "a.md", False),
+        (site_dir / "c.html", False),
+        (site_dir / "b.md", True),
+        (site_dir / "d.xyz", False),
+    ]
+
+    builder = DefaultPageBuilder(site_dir)
+    pages = builder.build_all(items)
+    expected = [builder.build(path, draft) for path, draft in items]
+    assert [p.path for p in pages] == [path for path, _ in items]
+    assert [(p.content, p.toc, p.draft) for p in pages] == [
+        (p.content, p.toc, p.draft) for p in expected
+    ]
+    assert 'src="/assets/images/posts/x.png"' in pages[0].content
+    assert pages[3].source_type == "unknown"
+
+
+def test_page_builder_renders_serially_without_a_usable_pool(tmp_path, monkeypatch):
+    """Test build_all falls back to serial rendering if the pool breaks."""
+    import concurrent.futures
+    from concurrent.futures.process import BrokenProcessPool
+
+    import medusa.content as content_module
+
+    class BrokenPool:
+        def __init__(self, *args, **kwargs):
+            pass
+
+        def __enter__(self):
+            raise BrokenProcessPool("worker died")
+
+        def __exit__(self, *exc):
+            return False
+
+    monkeypatch.setattr(content_module, "PARALLEL_RENDER_THRESHOLD", 2)
+    monkeypatch.setattr(concurrent.futures, "ProcessPoolExecutor", BrokenPool)
+    site_dir = tmp_path / "site"
+    site_dir.mkdir()
+    (site_dir / "a.md").write_text("# A")
+    (site_dir / "b.md").write_text("# B")
+    items = [(site_dir / "a.md", False), (site_dir / "b.md", False)]
+
+    monkeypatch.setattr(content_module.os, "cpu_count", lambda: 1)
+    single = DefaultPageBuilder(site_dir).build_all(items)
+    monkeypatch.setattr(content_module.os, "cpu_count", lambda: 4)
+    broken = DefaultPageBuilder(site_dir).build_all(items)
+    assert [p.toc[0].text for p in single] == ["A", "B"]
+    assert [p.content for p in broken] == [p.content for p in single]
+
+
+def test_page_builder_reuses_cached_markdown_renders(tmp_path, monkeypatch):
+    """Test build_all serves unchanged markdown from the render cache."""
+    import medusa.content as content_module
+
+    site_dir = tmp_path / "site"
+    site_dir.mkdir()
+    (site_dir / "a.md").write_text("# A\n\n![x](x.png)")
+    (site_dir / "b.md").write_text("# B")
+    cache_dir = tmp_path / "cache"
+    items = [(site_dir / "a.md", False), (site_dir / "b.md", False)]
+
+    first = DefaultPageBuilder(site_dir, cache_dir=cache_dir).build_all(items)
+    assert len(list(cache_dir.glob("*.json"))) == 2
+
+    calls = []
+    original = content_module.render_markdown
+
+    def counting_render(content, folder):
+        calls.append(content)
+        return original(content, folder)
+
+    monkeypatch.setattr(content_module, "render_markdown", counting_render)
+    # Corrupt one entry; it is re-rendered and rewritten
+    sorted(cache_dir.glob("*.json"))[0].write_text("{not json")
+    second = DefaultPageBuilder(site_dir, cache_dir=cache_dir).build_all(items)
+    assert len(calls) == 1
+    assert [(p.content, p.toc) for p in second] == [(p.content, p.toc) for p in first]
+    assert second[0].toc[0].id == "a"
+
+
+def test_page_builder_prunes_unused_render_cache_entries(tmp_path):
+    """Test build_all drops cached renders no current page uses."""
+    site_dir = tmp_path / "site"
+    site_dir.mkdir()
+    page = site_dir / "a.md"
+    page.write_text("# A")
+    cache_dir = tmp_path / "cache"
+    cache_dir.mkdir()
+    (cache_dir / "notes.txt").write_text("kept")
+
+    DefaultPageBuilder(site_dir, cache_dir=cache_dir).build_all([(page, False)])
+    (first,) = cache_dir.glob("*.json")
+    page.write_text("# A, edited")
+    DefaultPageBuilder(site_dir, cache_dir=cache_dir).build_all([(page, False)])
+    (second,) = cache_dir.glob("*.json")
+    assert second != first
+    assert (cache_dir / "notes.txt").exists()
+
+
+def test_render_fingerprint_includes_medusa_version():
+    """Test upgrading medusa invalidates cached markdown renders."""
+    from medusa import __version__
+    from medusa.renderers import RENDERER_FINGERPRINT
+
+    assert f"medusa-{__version__}" in RENDERER_FINGERPRINT
+
+
+def test_page_builder_ignores_unwritable_render_cache(tmp_path):
+    """Test build_all still renders when the cache cannot be written."""
+    site_dir = tmp_path / "site"
+    site_dir.mkdir()
+    (site_dir / "a.md").write_text("# A")
+    blocker = tmp_path / "cache"
+    blocker.write_text("not a directory")
+
+    builder = DefaultPageBuilder(site_dir, cache_dir=blocker / "render")
+    pages = builder.build_all([(site_dir / "a.md", False)])
+    assert pages[0].toc[0].text == "A"
+    assert list(tmp_path.glob("cache*")) == [blocker]
+
+
+def test_content_processor_with_builder_without_build_all(tmp_path):
+    """Test ContentProcessor falls back to build() for custom page builders."""
+    site_dir = tmp_path / "site"
+    site_dir.mkdir()
+    (site_dir / "a.md").write_text("# A")
+    (site_dir / "_b.md").write_text("# B")
+
+    class SimpleBuilder:
+        def __init__(self):
+            self.inner = DefaultPageBuilder(site_dir)
+
+        def build(self, path, draft=False):
+            return self.inner.build(path, draft)
+
+    processor = ContentProcessor(site_dir, page_builder=SimpleBuilder())
+    pages = processor.load(include_drafts=True)
+    assert sorted((p.filename, p.draft) for p in pages) == [
+        ("_b.md", True),
+        ("a.md", False),
+    ]
+
+
+def test_content_processor_uses_overridden_build(tmp_path):
+    """Test a DefaultPageBuilder subclass's build() is not bypassed."""
+    site_dir = tmp_path / "site"
+    site_dir.mkdir()
+    (site_dir / "a.md").write_text("# Hi")
+
+    class CustomBuilder(DefaultPageBuilder):
+        def build(self, path, draft=False):
+            page = super().build(path, draft)
+            page.title = "CUSTOM"
+            return page
+
+    processor = ContentProcessor(site_dir, page_builder=CustomBuilder(site_dir))
+    assert [p.title for p in processor.load()] == ["CUSTOM"]
+
+
 # --- Protocol Tests (verify implementations match protocols) ---
 
 
@@ -552,12 +1041,12 @@ def test_tailwind_processor_with_cli(tmp_path, monkeypatch):
     def mock_which(name):
         return "/usr/bin/tailwindcss"
 
-    def mock_run(cmd, capture_output=None, text=None):
+    def mock_run(cmd, stdout=None, stderr=None):
         # Simulate successful build
         dest = Path(cmd[4])
         dest.parent.mkdir(parents=True, exist_ok=True)
         dest.write_text("built css")
-        return subprocess.CompletedProcess(cmd, 0, stdout="ok", stderr="")
+        return subprocess.CompletedProcess(cmd, 0, stdout=b"ok", stderr=b"")
 
     monkeypatch.setattr("shutil.which", mock_which)
     monkeypatch.setattr("subprocess.run", mock_run)
@@ -578,8 +1067,8 @@ def test_tailwind_processor_failure(tmp_path, monkeypatch, capsys):
     def mock_which(name):
         return "/usr/bin/tailwindcss"
 
-    def mock_run(cmd, capture_output=None, text=None):
-        return subprocess.CompletedProcess(cmd, 1, stdout="", stderr="error")
+    def mock_run(cmd, stdout=None, stderr=None):
+        return subprocess.CompletedProcess(cmd, 1, stdout=b"", stderr=b"error")
 
     monkeypatch.setattr("shutil.which", mock_which)
     monkeypatch.setattr("subprocess.run", mock_run)
@@ -606,11 +1095,11 @@ def test_tailwind_processor_local_binary(tmp_path, monkeypatch):
     local_bin.parent.mkdir(parents=True)
     local_bin.write_text("#!/bin/sh\necho ok")
 
-    def mock_run(cmd, capture_output=None, text=None):
+    def mock_run(cmd, stdout=None, stderr=None):
         dest = Path(cmd[4])
         dest.parent.mkdir(parents=True, exist_ok=True)
         dest.write_text("built css")
-        return subprocess.CompletedProcess(cmd, 0, stdout="ok", stderr="")
+        return subprocess.CompletedProcess(cmd, 0, stdout=b"ok", stderr=b"")
 
     monkeypatch.setattr("subprocess.run", mock_run)
 
@@ -635,8 +1124,8 @@ def test_js_processor_terser_failure(tmp_path, monkeypatch, capsys):
     terser_bin.parent.mkdir(parents=True)
     terser_bin.write_text("#!/bin/sh\nexit 1")
 
-    def mock_run(cmd, capture_output=None, text=None):
-        return subprocess.CompletedProcess(cmd, 1, stdout="", stderr="terser error")
+    def mock_run(cmd, stdout=None, stderr=None):
+        return subprocess.CompletedProcess(cmd, 1, stdout=b"", stderr=b"terser error")
 
     monkeypatch.setattr("subprocess.run", mock_run)
 
@@ -660,6 +1149,35 @@ def test_asset_registry_process_no_processor():
     assert result is False
 
 
+def test_asset_registry_shares_known_dirs(tmp_path, monkeypatch):
+    """Test registered processors skip mkdir for directories already created."""
+    registry = AssetProcessorRegistry()
+    processor = StaticAssetProcessor()
+    registry.register(processor)
+    out = tmp_path / "out"
+    registry.ensure_dir(out)
+    registry.ensure_dir(out)
+    assert out.is_dir()
+    assert processor.known_dirs == {out}
+
+    calls = []
+    original_mkdir = Path.mkdir
+
+    def counting_mkdir(self, *args, **kwargs):
+        calls.append(self)
+        return original_mkdir(self, *args, **kwargs)
+
+    monkeypatch.setattr(Path, "mkdir", counting_mkdir)
+    for name in ("a.txt", "b.txt"):
+        source = tmp_path / name
+        source.write_text(name)
+        assert registry.process(source, out / name) is True
+        assert registry.process(source, out / "sub" / name) is True
+
+    assert calls == [out / "sub"]
+    assert (out / "sub" / "b.txt").read_text() == "b.txt"
+
+
 def test_content_processor_unknown_source_type(tmp_path):
     """Test DefaultPageBuilder with unknown file type."""
     site_dir = tmp_path / "site"
@@ -719,11 +1237,11 @@ def test_js_processor_terser_success(tmp_path, monkeypatch):
     monkeypatch.setattr("medusa.asset_processors.jsmin", None)
     monkeypatch.setattr("shutil.which", lambda x: "/usr/bin/terser")
 
-    def mock_run(cmd, capture_output=None, text=None):
+    def mock_run(cmd, stdout=None, stderr=None):
         dest = Path(cmd[cmd.index("-o") + 1])
         dest.parent.mkdir(parents=True, exist_ok=True)
         dest.write_text("minified")
-        return subprocess.CompletedProcess(cmd, 0, stdout="ok", stderr="")
+        return subprocess.CompletedProcess(cmd, 0, stdout=b"ok", stderr=b"")
 
     monkeypatch.setattr("subprocess.run", mock_run)
 
@@ -737,6 +1255,391 @@ def test_js_processor_terser_success(tmp_path, monkeypatch):
     assert dest.read_text() == "minified"
 
 
+def test_js_processor_cache_hit(tmp_path, monkeypatch):
+    """Test JSProcessor reuses cached output for unchanged sources."""
+    processor = JSProcessor(tmp_path)
+    source = tmp_path / "app.js"
+    source.write_text("function test() { return 1; }")
+    dest = tmp_path / "out" / "app.js"
+    processor.process(source, dest)
+    assert list((tmp_path / ".medusa-cache" / "js").iterdir())
+
+    def fail_jsmin(content):
+        raise AssertionError("cache miss")
+
+    monkeypatch.setattr("medusa.asset_processors.jsmin", fail_jsmin)
+    other = tmp_path / "out2" / "app.js"
+    JSProcessor(tmp_path).process(source, other)
+    assert other.read_text() == dest.read_text()
+
+
+def test_js_processor_memoizes_terser_lookup(tmp_path, monkeypatch):
+    """Test JSProcessor resolves terser once per processor."""
+    lookups = []
+
+    def mock_which(name):
+        lookups.append(name)
+        return None
+
+    monkeypatch.setattr("medusa.asset_processors.jsmin", None)
+    monkeypatch.setattr("shutil.which", mock_which)
+    processor = JSProcessor(tmp_path)
+    for name in ("a.js", "b.js"):
+        source = tmp_path / name
+        source.write_text(f"var {name[0]} = 1;")
+        processor.process(source, tmp_path / "out" / name)
+    assert lookups == ["terser"]
+
+
+def test_find_executable_cached(tmp_path, monkeypatch):
+    """Test executable hits are shared and revalidated, local installs noticed."""
+    from medusa.asset_processors import find_executable_cached
+
+    monkeypatch.setattr("shutil.which", lambda x: None)
+    assert find_executable_cached("tailwindcss", tmp_path) is None
+
+    local_bin = tmp_path / "node_modules" / ".bin" / "tailwindcss"
+    local_bin.parent.mkdir(parents=True)
+    local_bin.write_text("#!/bin/sh")
+    assert find_executable_cached("tailwindcss", tmp_path) == str(local_bin)
+
+    lookups = []
+    monkeypatch.setattr("shutil.which", lambda x: lookups.append(x))
+    assert find_executable_cached("tailwindcss", tmp_path) == str(local_bin)
+
+    local_bin.unlink()
+    assert find_executable_cached("tailwindcss", tmp_path) is None
+    # Only the miss after the stale hit searched PATH
+    assert lookups == ["tailwindcss"]
+
+
+def test_find_executable_cached_sees_new_path_install(tmp_path, monkeypatch):
+    """Test a tool added to PATH after a miss is found on the next lookup."""
+    from medusa.asset_processors import find_executable_cached
+
+    bin_dir = tmp_path / "bin"
+    bin_dir.mkdir()
+    monkeypatch.setenv("PATH", str(bin_dir))
+    assert find_executable_cached("tailwindcss", tmp_path) is None
+
+    tool = bin_dir / "tailwindcss"
+    tool.write_text("#!/bin/sh\n")
+    tool.chmod(0o755)
+    assert find_executable_cached("tailwindcss", tmp_path) == str(tool)
+
+
+def test_which_cached_remembers_misses_per_path(monkeypatch):
+    """Test which_cached searches PATH once per (name, PATH)."""
+    from medusa.asset_processors import which_cached
+
+    lookups = []
+
+    def fake_which(name):
+        lookups.append(name)
+        return None
+
+    monkeypatch.setattr("shutil.which", fake_which)
+    monkeypatch.setenv("PATH", "/usr/bin")
+    assert which_cached("oxipng") is None
+    assert which_cached("oxipng") is None
+    assert lookups == ["oxipng"]
+
+    monkeypatch.setenv("PATH", "/opt/bin:/usr/bin")
+    assert which_cached("oxipng") is None
+    assert lookups == ["oxipng", "oxipng"]
+
+    clear_executable_cache()
+    monkeypatch.setattr("shutil.which", lambda name: f"/opt/bin/{name}")
+    assert which_cached("oxipng") == "/opt/bin/oxipng"
+
+
+def test_fast_copy_hardlinks(tmp_path):
+    """Test _fast_copy hardlinks when possible and replaces stale files."""
+    from medusa.asset_processors import _fast_copy
+
+    source = tmp_path / "font.woff2"
+    source.write_text("font")
+    dest = tmp_path / "dest.woff2"
+    dest.write_text("stale")
+    _fast_copy(source, dest)
+    assert dest.read_text() == "font"
+    assert dest.stat().st_ino == source.stat().st_ino
+
+
+def test_fast_copy_falls_back_to_copy(tmp_path, monkeypatch):
+    """Test _fast_copy copies when hardlinks and reflinks are unsupported."""
+    from medusa.asset_processors import _fast_copy
+
+    def no_link(src, dst):
+        raise OSError("cross-device link")
+
+    def no_clone(fd, request, arg):
+        raise OSError("operation not supported")
+
+    monkeypatch.setattr("os.link", no_link)
+    monkeypatch.setattr("fcntl.ioctl", no_clone)
+    source = tmp_path / "cached.js"
+    source.write_text("cached")
+    dest = tmp_path / "dest.js"
+    dest.write_text("stale")
+    _fast_copy(source, dest)
+    assert dest.read_text() == "cached"
+    assert dest.stat().st_ino != source.stat().st_ino
+
+
+def test_fast_copy_uses_reflink(tmp_path, monkeypatch):
+    """Test _fast_copy clones via FICLONE when hardlinks fail."""
+    import os
+
+    from medusa.asset_processors import _FICLONE, _fast_copy
+
+    calls = []
+
+    def no_link(src, dst):
+        raise OSError("cross-device link")
+
+    def fake_clone(fd, request, arg):
+        calls.append(request)
+        os.write(fd, os.pread(arg, 100, 0))
+
+    monkeypatch.setattr("os.link", no_link)
+    monkeypatch.setattr("fcntl.ioctl", fake_clone)
+    source = tmp_path / "logo.svg"
+    source.write_text("svg")
+    dest = tmp_path / "dest.svg"
+    _fast_copy(source, dest)
+    assert calls == [_FICLONE]
+    assert dest.read_text() == "svg"
+
+
+def test_fast_copy_uses_copy_file_range(tmp_path, monkeypatch):
+    """Test _fast_copy copies in the kernel when links and clones fail."""
+    import os
+
+    from medusa.asset_processors import _fast_copy
+
+    real_copy_file_range = os.copy_file_range
+    sizes = []
+
+    def no_link(src, dst):
+        raise OSError("cross-device link")
+
+    def no_clone(fd, request, arg):
+        raise OSError("operation not supported")
+
+    def short_copy(src_fd, dst_fd, count, offset_src, offset_dst):
+        sizes.append(count)
+        return real_copy_file_range(
+            src_fd, dst_fd, min(count, 4), offset_src, offset_dst
+        )
+
+    monkeypatch.setattr("os.link", no_link)
+    monkeypatch.setattr("fcntl.ioctl", no_clone)
+    monkeypatch.setattr("os.copy_file_range", short_copy)
+    source = tmp_path / "font.woff2"
+    source.write_bytes(b"0123456789")
+    dest = tmp_path / "dest.woff2"
+    _fast_copy(source, dest)
+    assert dest.read_bytes() == b"0123456789"
+    assert sizes == [10, 6, 2]
+
+
+def test_kernel_copy_fallbacks(tmp_path, monkeypatch):
+    """Test _kernel_copy falls back to sendfile, then userspace."""
+    import os
+
+    from medusa.asset_processors import _kernel_copy
+
+    sent = []
+    real_sendfile = os.sendfile
+
+    def no_clone(fd, request, arg):
+        raise OSError("operation not supported")
+
+    def no_copy_range(src_fd, dst_fd, count, offset_src, offset_dst):
+        raise OSError("cross-filesystem copy")
+
+    def counting_sendfile(out_fd, in_fd, offset, count):
+        sent.append(count)
+        return real_sendfile(out_fd, in_fd, offset, count)
+
+    monkeypatch.setattr("fcntl.ioctl", no_clone)
+    monkeypatch.setattr("os.copy_file_range", no_copy_range)
+    monkeypatch.setattr("os.sendfile", counting_sendfile)
+    source = tmp_path / "a.bin"
+    source.write_bytes(b"payload")
+    dest = tmp_path / "b.bin"
+    with open(source, "rb") as src, open(dest, "wb") as dst:
+        _kernel_copy(src, dst)
+    assert dest.read_bytes() == b"payload"
+    assert sent == [7]
+
+    def unsupported(out_fd, in_fd, offset, count):
+        raise OSError("sendfile needs a socket")
+
+    monkeypatch.setattr("os.sendfile", unsupported)
+    with open(source, "rb") as src, open(dest, "wb") as dst:
+        _kernel_copy(src, dst)
+    assert dest.read_bytes() == b"payload"
+
+
+def test_kernel_copy_stops_on_truncation_or_partial_failure(tmp_path, monkeypatch):
+    """Test _kernel_copy stops at EOF and re-raises errors after a partial copy."""
+    import os
+
+    from medusa.asset_processors import _kernel_copy
+
+    def no_clone(fd, request, arg):
+        raise OSError("operation not supported")
+
+    monkeypatch.setattr("fcntl.ioctl", no_clone)
+    monkeypatch.setattr(
+        "os.copy_file_range", lambda src_fd, dst_fd, count, o_src, o_dst: 0
+    )
+    source = tmp_path / "a.bin"
+    source.write_bytes(b"payload")
+    dest = tmp_path / "b.bin"
+    with open(source, "rb") as src, open(dest, "wb") as dst:
+        _kernel_copy(src, dst)
+    assert dest.read_bytes() == b""
+
+    def fails_midway(src_fd, dst_fd, count, offset_src, offset_dst):
+        if offset_src:
+            raise OSError("disk full")
+        return os.write(dst_fd, b"pay")
+
+    monkeypatch.setattr("os.copy_file_range", fails_midway)
+    with open(source, "rb") as src, open(dest, "wb") as dst:
+        with pytest.raises(OSError, match="disk full"):
+            _kernel_copy(src, dst)
+
+
+def test_file_cache_key_matches_bytes_key(tmp_path):
+    """Test memory-mapped hashing matches hashing the file contents."""
+    from medusa.asset_processors import _cache_key, _file_cache_key
+
+    full = tmp_path / "app.js"
+    full.write_bytes(b"var a = 1;")
+    empty = tmp_path / "empty.js"
+    empty.write_bytes(b"")
+    assert _file_cache_key(1, full) == _cache_key(1, b"var a = 1;")
+    assert _file_cache_key(1, empty) == _cache_key(1, b"")
+
+
+def test_store_in_cache_ignores_errors(tmp_path):
+    """Test caching a missing build output is a silent no-op."""
+    from medusa.asset_processors import _store_in_cache
+
+    cache_file = tmp_path / "cache" / "entry.css"
+    _store_in_cache(tmp_path / "missing.css", cache_file)
+    assert not cache_file.exists()
+
+
+def test_store_in_cache_removes_partial_file(tmp_path, monkeypatch):
+    """Test a failed rename leaves no temporary file behind."""
+    from medusa.asset_processors import _store_in_cache
+
+    built = tmp_path / "built.css"
+    built.write_text("css")
+
+    def failing_replace(src, dst):
+        raise OSError("disk full")
+
+    monkeypatch.setattr("os.replace", failing_replace)
+    _store_in_cache(built, tmp_path / "cache" / "entry.css")
+    assert list((tmp_path / "cache").iterdir()) == []
+
+
+def test_tailwind_processor_content_files(tmp_path):
+    """Test TailwindCSSProcessor lists the files Tailwind scans."""
+    (tmp_path / "site" / "posts").mkdir(parents=True)
+    (tmp_path / "assets" / "js").mkdir(parents=True)
+    (tmp_path / "site" / "index.jinja").write_text("")
+    (tmp_path / "site" / "posts" / "a.md").write_text("")
+    (tmp_path / "site" / "posts" / "b.txt").write_text("")
+    (tmp_path / "assets" / "js" / "app.js").write_text("")
+    (tmp_path / "assets" / "css").mkdir()
+    (tmp_path / "assets" / "css" / "extra.css").write_text("")
+    (tmp_path / "tailwind.config.js").write_text("")
+
+    processor = TailwindCSSProcessor(tmp_path, tmp_path / "out")
+    files = [
+        Path(f).relative_to(tmp_path).as_posix() for f in processor._content_files()
+    ]
+    assert files == [
+        "assets/css/extra.css",
+        "assets/js/app.js",
+        "site/index.jinja",
+        "site/posts/a.md",
+        "tailwind.config.js",
+    ]
+
+
+def test_tailwind_processor_cache_hit(tmp_path, monkeypatch):
+    """Test TailwindCSSProcessor skips the CLI when inputs are unchanged."""
+    import subprocess
+
+    calls = []
+
+    def mock_run(cmd, stdout=None, stderr=None):
+        calls.append(cmd)
+        Path(cmd[4]).write_text("built css")
+        return subprocess.CompletedProcess(cmd, 0, stdout=b"ok", stderr=b"")
+
+    monkeypatch.setattr("shutil.which", lambda x: "/usr/bin/tailwindcss")
+    monkeypatch.setattr("subprocess.run", mock_run)
+    (tmp_path / "site").mkdir()
+    page = tmp_path / "site" / "index.md"
+    page.write_text("# Home")
+
+    processor = TailwindCSSProcessor(tmp_path, tmp_path / "out")
+    source = tmp_path / "main.css"
+    source.write_text("@tailwind base;")
+    dest = tmp_path / "out" / "main.css"
+
+    processor.process(source, dest)
+    processor.process(source, dest)
+    assert len(calls) == 1
+    assert dest.read_text() == "built css"
+
+    # Touching a content file invalidates the cache
+    page.write_text("# Home, edited")
+    processor.process(source, dest)
+    assert len(calls) == 2
+    # Only the latest build is kept
+    assert len(list((tmp_path / ".medusa-cache" / "css").glob("*.css"))) == 1
+
+
+def test_tailwind_processor_tracks_imported_css(tmp_path, monkeypatch):
+    """Test editing a stylesheet main.css imports invalidates the cache."""
+    import subprocess
+
+    calls = []
+
+    def mock_run(cmd, stdout=None, stderr=None):
+        calls.append(cmd)
+        Path(cmd[4]).write_text(f"built {len(calls)}")
+        return subprocess.CompletedProcess(cmd, 0, stdout=b"", stderr=b"")
+
+    monkeypatch.setattr("shutil.which", lambda x: "/usr/bin/tailwindcss")
+    monkeypatch.setattr("subprocess.run", mock_run)
+    css_dir = tmp_path / "assets" / "css"
+    css_dir.mkdir(parents=True)
+    source = css_dir / "main.css"
+    source.write_text('@import "./extra.css";')
+    extra = css_dir / "extra.css"
+    extra.write_text("a { color: red; }")
+    processor = TailwindCSSProcessor(tmp_path, tmp_path / "out")
+
+    processor.process(source, tmp_path / "out1" / "main.css")
+    extra.write_text("a { color: blue; }")
+    # A fresh output directory, as `medusa serve` uses on each rebuild
+    dest = tmp_path / "out2" / "main.css"
+    processor.process(source, dest)
+    assert len(calls) == 2
+    assert dest.read_text() == "built 2"
+
+
 def test_content_processor_rewrite_inline_images(tmp_path):
     """Test ContentProcessor._rewrite_inline_images backward compatibility."""
     from medusa.content import ContentProcessor
@@ -1,6 +1,9 @@
 from datetime import datetime
 from pathlib import Path
 
+import pytest
+import yaml
+
 from medusa import utils
 
 
@@ -23,6 +26,32 @@ def test_extract_date_tags_and_strip():
     assert utils.strip_hashtags(text).startswith("Talking about python")
 
 
+def test_hashtag_helpers_share_one_scan():
+    text = "Fused #scan over #tags and #scan."
+    utils._scan_hashtags.cache_clear()
+    tags = utils.extract_tags(text)
+    tags.append("mutated")
+    assert utils.strip_hashtags(text) == "Fused scan over tags and scan."
+    assert utils.extract_tags(text) == ["scan", "tags"]
+    info = utils._scan_hashtags.cache_info()
+    assert (info.misses, info.hits) == (1, 2)
+
+
+def test_read_source_matches_read_text(tmp_path):
+    path = tmp_path / "page.md"
+    path.write_bytes("caf\u00e9\r\nline\rlast\n\r\n".encode())
+    assert utils.read_source(path) == path.read_text(encoding="utf-8")
+    plain = tmp_path / "plain.md"
+    plain.write_bytes(b"no carriage returns\n")
+    assert utils.read_source(str(plain)) == "no carriage returns\n"
+
+
+def test_iter_paragraphs_matches_split():
+    for text in ["", "a", "a\n\nb", "\n\n\n\na\n\n \n\nb\n\n", "x\n\n\ny", "  \n"]:
+        expected = [p.strip() for p in text.split("\n\n") if p.strip()]
+        assert list(utils.iter_paragraphs(text)) == expected
+
+
 def test_first_paragraph_and_wrapping(tmp_path):
     text = "First paragraph.\n\nSecond paragraph that should be ignored."
     assert utils.first_paragraph(text, limit=40) == "First paragraph."
@@ -131,3 +160,21 @@ def test_join_and_absolutize_urls():
     assert "cdn.com" in rewritten
     assert "#frag" in rewritten
     assert utils.absolutize_html_urls(html, "") == html
+
+
+def test_load_yaml_is_safe():
+    load_yaml = utils.load_yaml
+
+    assert load_yaml("a: 1\nb: [x, y]\n") == {"a": 1, "b": ["x", "y"]}
+    assert load_yaml(b"") is None
+    with pytest.raises(yaml.YAMLError):
+        load_yaml("!!python/object/apply:os.system ['true']")
+
+
+def test_load_yaml_mapping():
+    load_yaml_mapping = utils.load_yaml_mapping
+
+    assert load_yaml_mapping("a: 1") == {"a": 1}
+    assert load_yaml_mapping("") == {}
+    assert load_yaml_mapping("- a\n- b") is None
+    assert load_yaml_mapping("a: [unclosed") is None